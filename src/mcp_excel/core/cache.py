@@ -6,6 +6,7 @@
 """LRU cache for Excel files with automatic memory management."""
 
 import os
+import threading
 import time
 from collections import OrderedDict
 from pathlib import Path
@@ -14,6 +15,34 @@ from typing import Any, Optional, Tuple
 import pandas as pd
 import psutil
 
+# Seconds a process RSS reading is reused before memory_info() is called again
+# (every cache get and every tool response reads it; each read is a syscall / /proc parse)
+MEMORY_CHECK_INTERVAL = 0.1
+
+# PID is fixed for the process lifetime - create the handle once
+_process = psutil.Process()
+_memory_lock = threading.Lock()
+_memory_mb = 0.0
+_memory_checked_at: Optional[float] = None
+
+
+def get_process_memory_mb() -> float:
+    """Get current process memory usage (RSS) in MB.
+
+    A reading is reused for MEMORY_CHECK_INTERVAL seconds, so bursts of cache
+    lookups and performance metrics share one memory_info() call.
+
+    Returns:
+        Memory usage in megabytes
+    """
+    global _memory_mb, _memory_checked_at
+    with _memory_lock:
+        now = time.monotonic()
+        if _memory_checked_at is None or now - _memory_checked_at >= MEMORY_CHECK_INTERVAL:
+            _memory_mb = _process.memory_info().rss / 1024 / 1024
+            _memory_checked_at = now
+        return _memory_mb
+
 
 class FileCache:
     """LRU cache for loaded Excel files with memory monitoring."""
@@ -36,6 +65,8 @@ class FileCache:
         self._max_memory_mb = max_memory_mb
         self._idle_timeout = idle_timeout_seconds
         self._last_access = time.time()
+        # Operations may run in worker threads (see StatisticsOperations)
+        self._lock = threading.RLock()
 
     def _compute_cache_key(self, file_path: Path) -> str:
         """Compute cache key from file path and modification time.
@@ -50,15 +81,6 @@ class FileCache:
         mtime = os.path.getmtime(abs_path)
         return f"{abs_path}::{mtime}"
 
-    def _check_memory_usage(self) -> float:
-        """Check current process memory usage in MB.
-
-        Returns:
-            Memory usage in megabytes
-        """
-        process = psutil.Process()
-        return process.memory_info().rss / 1024 / 1024
-
     def _evict_oldest(self) -> None:
         """Remove the least recently used item from cache."""
         if self._cache:
@@ -74,7 +96,7 @@ class FileCache:
             return
 
         # Check memory usage
-        memory_mb = self._check_memory_usage()
+        memory_mb = get_process_memory_mb()
         if memory_mb > self._max_memory_mb:
             # Evict half of the cache
             items_to_remove = len(self._cache) // 2
@@ -96,16 +118,17 @@ class FileCache:
         if sheet_name:
             cache_key = f"{cache_key}::{sheet_name}"
 
-        self._cleanup_if_needed()
+        with self._lock:
+            self._cleanup_if_needed()
 
-        if cache_key in self._cache:
-            # Move to end (mark as recently used)
-            df, _ = self._cache.pop(cache_key)
-            self._cache[cache_key] = (df, time.time())
-            self._last_access = time.time()
-            return df
+            if cache_key in self._cache:
+                # Move to end (mark as recently used)
+                df, _ = self._cache.pop(cache_key)
+                self._cache[cache_key] = (df, time.time())
+                self._last_access = time.time()
+                return df
 
-        return None
+            return None
 
     def put(
         self, file_path: Path, df: pd.DataFrame, sheet_name: Optional[str] = None
@@ -121,16 +144,17 @@ class FileCache:
         if sheet_name:
             cache_key = f"{cache_key}::{sheet_name}"
 
-        # Remove if already exists (to update position)
-        if cache_key in self._cache:
-            del self._cache[cache_key]
+        with self._lock:
+            # Remove if already exists (to update position)
+            if cache_key in self._cache:
+                del self._cache[cache_key]
 
-        # Evict oldest if at capacity
-        if len(self._cache) >= self._max_size:
-            self._evict_oldest()
+            # Evict oldest if at capacity
+            if len(self._cache) >= self._max_size:
+                self._evict_oldest()
 
-        self._cache[cache_key] = (df, time.time())
-        self._last_access = time.time()
+            self._cache[cache_key] = (df, time.time())
+            self._last_access = time.time()
 
     def invalidate(self, file_path: Path) -> None:
         """Remove all entries for a specific file from cache.
@@ -139,13 +163,15 @@ class FileCache:
             file_path: Path to the file to invalidate
         """
         abs_path = str(file_path.resolve())
-        keys_to_remove = [key for key in self._cache if key.startswith(abs_path)]
-        for key in keys_to_remove:
-            del self._cache[key]
+        with self._lock:
+            keys_to_remove = [key for key in self._cache if key.startswith(abs_path)]
+            for key in keys_to_remove:
+                del self._cache[key]
 
     def clear(self) -> None:
         """Clear entire cache."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
 
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics.
@@ -156,7 +182,7 @@ class FileCache:
         return {
             "size": len(self._cache),
             "max_size": self._max_size,
-            "memory_mb": self._check_memory_usage(),
+            "memory_mb": get_process_memory_mb(),
             "max_memory_mb": self._max_memory_mb,
             "idle_seconds": time.time() - self._last_access,
         }
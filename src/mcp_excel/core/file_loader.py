@@ -6,6 +6,9 @@
 """File loader with automatic format detection and caching."""
 
 import os
+import threading
+from contextlib import closing
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -15,6 +18,29 @@ from .cache import FileCache
 from .datetime_converter import DateTimeConverter
 from .datetime_detector import DateTimeDetector
 
+# Maximum number of (file, mtime, sheet) detected header rows kept in memory
+MAX_HEADER_CACHE_ENTRIES = 128
+
+
+@lru_cache(maxsize=64)
+def _read_sheet_names(path: str, mtime_ns: int, size: int, engine: str) -> tuple[str, ...]:
+    """Read sheet names from workbook (memoized per file version).
+
+    mtime_ns and size are part of the key so a modified file is re-read.
+
+    Args:
+        path: Absolute path to the Excel file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+        engine: Pandas engine name
+
+    Returns:
+        Tuple of sheet names
+    """
+    # Use context manager to ensure file is closed (prevents descriptor leaks)
+    with pd.ExcelFile(path, engine=engine) as excel_file:
+        return tuple(excel_file.sheet_names)
+
 
 class FileLoader:
     """Loads Excel files with automatic format detection and caching."""
@@ -26,6 +52,14 @@ class FileLoader:
             cache: Optional FileCache instance. If None, creates default cache.
         """
         self._cache = cache or FileCache()
+        # Detected header row per (file, mtime, sheet), shared by every
+        # operations class using this loader (see BaseOperations)
+        self._header_rows: dict[tuple[str, Optional[int], str], int] = {}
+        # Statistics tools load from worker threads (see StatisticsOperations)
+        self._header_lock = threading.Lock()
+        # Bumped by invalidate_cache()/clear_cache() so results cached outside
+        # the loader (see StatisticsOperations) are not reused afterwards
+        self._cache_version = 0
         self._datetime_detector = DateTimeDetector()
         self._datetime_converter = DateTimeConverter()
 
@@ -97,26 +131,26 @@ class FileLoader:
             )
         
         # Try cache first
+        sheet_key = str(sheet_name) if sheet_name is not None else "0"
+        # Include header_row and convert_dates in cache key
+        cache_key = f"{sheet_key}::header_{header_row}::dates_{convert_dates}"
         if use_cache:
-            sheet_key = str(sheet_name) if sheet_name is not None else "0"
-            # Include header_row and convert_dates in cache key
-            cache_key = f"{sheet_key}::header_{header_row}::dates_{convert_dates}"
             cached_df = self._cache.get(path, cache_key)
             if cached_df is not None:
                 return cached_df
 
-        # Detect format and engine
         file_format = self._detect_format(path)
-        engine = self._get_engine(file_format)
 
-        # Load file with specified header (None = raw data, int = specific row)
         try:
-            df = pd.read_excel(
-                path,
-                sheet_name=sheet_name,
-                engine=engine,
-                header=header_row,
-            )
+            if header_row is None:
+                # Header detection previews this raw view - share one cached parse
+                raw_df = self._load_raw(path, sheet_name, file_format, use_cache)
+                if not convert_dates:
+                    return raw_df
+                # Convert dates on a copy so the cached parse stays unconverted
+                df = raw_df.copy()
+            else:
+                df = self._read_sheet(path, sheet_name, file_format, header_row)
 
             # Convert dates if requested
             if convert_dates:
@@ -124,8 +158,6 @@ class FileLoader:
             
             # Cache the result
             if use_cache:
-                sheet_key = str(sheet_name) if sheet_name is not None else "0"
-                cache_key = f"{sheet_key}::header_{header_row}::dates_{convert_dates}"
                 self._cache.put(path, df, cache_key)
 
             return df
@@ -133,6 +165,63 @@ class FileLoader:
         except Exception as e:
             raise Exception(f"Failed to load file {file_path}: {str(e)}") from e
 
+    def _load_raw(
+        self,
+        path: Path,
+        sheet_name: Optional[str | int],
+        file_format: str,
+        use_cache: bool,
+    ) -> pd.DataFrame:
+        """Parse sheet without header or date conversion (cached).
+
+        Args:
+            path: Path to the Excel file
+            sheet_name: Sheet name or index
+            file_format: File format ('xls' or 'xlsx')
+            use_cache: Whether to use cache
+
+        Returns:
+            Raw DataFrame (header=None)
+        """
+        sheet_key = str(sheet_name) if sheet_name is not None else "0"
+        cache_key = f"{sheet_key}::header_None::dates_False"
+        if use_cache:
+            cached_df = self._cache.get(path, cache_key)
+            if cached_df is not None:
+                return cached_df
+
+        df = self._read_sheet(path, sheet_name, file_format, None)
+
+        if use_cache:
+            self._cache.put(path, df, cache_key)
+
+        return df
+
+    def _read_sheet(
+        self,
+        path: Path,
+        sheet_name: Optional[str | int],
+        file_format: str,
+        header_row: Optional[int],
+    ) -> pd.DataFrame:
+        """Parse sheet from the workbook (no cache, no date conversion).
+
+        Args:
+            path: Path to the Excel file
+            sheet_name: Sheet name or index
+            file_format: File format ('xls' or 'xlsx')
+            header_row: Row index to use as header (None = raw data)
+
+        Returns:
+            Parsed DataFrame
+        """
+        return pd.read_excel(
+            path,
+            sheet_name=sheet_name,
+            engine=self._get_engine(file_format),
+            header=header_row,
+        )
+
     def get_sheet_names(self, file_path: str | Path) -> list[str]:
         """Get list of sheet names in Excel file.
 
@@ -158,9 +247,12 @@ class FileLoader:
         engine = self._get_engine(file_format)
 
         try:
-            # Use context manager to ensure file is closed (prevents descriptor leaks)
-            with pd.ExcelFile(path, engine=engine) as excel_file:
-                return excel_file.sheet_names
+            # Opening the workbook is expensive - every operation reports file
+            # metadata, so sheet names are memoized until the file changes
+            stat = path.stat()
+            return list(
+                _read_sheet_names(str(path.resolve()), stat.st_mtime_ns, stat.st_size, engine)
+            )
         except Exception as e:
             raise Exception(f"Failed to read sheet names from {file_path}: {str(e)}") from e
 
@@ -196,6 +288,61 @@ class FileLoader:
             "sheet_names": sheet_names,
         }
 
+    def _header_key(
+        self, file_path: str | Path, sheet_name: Optional[str | int]
+    ) -> tuple[str, Optional[int], str]:
+        """Build detected-header key for a sheet.
+
+        mtime is part of the key so detection re-runs when the file changes.
+
+        Args:
+            file_path: Path to the Excel file
+            sheet_name: Sheet name or index
+
+        Returns:
+            Tuple of (resolved path, mtime_ns, sheet)
+        """
+        try:
+            mtime_ns = os.stat(file_path).st_mtime_ns
+        except OSError:
+            # Missing file - load() raises the descriptive error
+            mtime_ns = None
+        # Resolved like FileCache keys, so relative/symlinked paths share entries
+        return (str(Path(file_path).resolve()), mtime_ns, str(sheet_name))
+
+    def get_detected_header(
+        self, file_path: str | Path, sheet_name: Optional[str | int]
+    ) -> Optional[int]:
+        """Get remembered auto-detected header row for a sheet.
+
+        Args:
+            file_path: Path to the Excel file
+            sheet_name: Sheet name or index
+
+        Returns:
+            Header row index, or None if not detected yet (or file changed)
+        """
+        key = self._header_key(file_path, sheet_name)
+        with self._header_lock:
+            return self._header_rows.get(key)
+
+    def remember_detected_header(
+        self, file_path: str | Path, sheet_name: Optional[str | int], header_row: int
+    ) -> None:
+        """Remember auto-detected header row for a sheet.
+
+        Args:
+            file_path: Path to the Excel file
+            sheet_name: Sheet name or index
+            header_row: Detected header row index
+        """
+        key = self._header_key(file_path, sheet_name)
+        with self._header_lock:
+            # Drop the oldest entry to keep memory bounded
+            if len(self._header_rows) >= MAX_HEADER_CACHE_ENTRIES:
+                self._header_rows.pop(next(iter(self._header_rows)), None)
+            self._header_rows[key] = header_row
+
     def invalidate_cache(self, file_path: str | Path) -> None:
         """Invalidate cache for specific file.
 
@@ -203,10 +350,26 @@ class FileLoader:
             file_path: Path to the file
         """
         self._cache.invalidate(Path(file_path))
+        path_key = str(Path(file_path).resolve())
+        with self._header_lock:
+            for key in [key for key in self._header_rows if key[0] == path_key]:
+                del self._header_rows[key]
+            self._cache_version += 1
 
     def clear_cache(self) -> None:
         """Clear entire cache."""
         self._cache.clear()
+        with self._header_lock:
+            self._header_rows.clear()
+            self._cache_version += 1
+
+    def get_cache_version(self) -> int:
+        """Get counter that changes whenever the cache is invalidated or cleared.
+
+        Returns:
+            Current cache version
+        """
+        return self._cache_version
 
     def _convert_datetime_columns(
         self,
@@ -278,8 +441,13 @@ class FileLoader:
             return {}
         
         try:
-            # Use context manager to ensure file is closed (prevents descriptor leaks)
-            with openpyxl.load_workbook(file_path, data_only=False, read_only=True) as wb:
+            # Use context manager to ensure file is closed (prevents descriptor leaks).
+            # Workbook has no __enter__/__exit__ - closing() calls wb.close().
+            # Streaming reader, no external link parsing (formats only)
+            workbook = openpyxl.load_workbook(
+                file_path, data_only=False, read_only=True, keep_links=False
+            )
+            with closing(workbook) as wb:
                 # Get worksheet
                 if isinstance(sheet_name, int):
                     ws = wb.worksheets[sheet_name]
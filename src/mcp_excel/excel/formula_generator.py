@@ -11,6 +11,38 @@ import pandas as pd
 
 from ..models.requests import FilterCondition, FilterGroup
 
+# Number of columns in an Excel worksheet (A..XFD)
+MAX_EXCEL_COLUMNS = 16_384
+
+
+def _compute_column_letter(col_index: int) -> str:
+    """Convert zero-based column index to Excel letter (A, ..., Z, AA, ...)."""
+    result = ""
+    col_index += 1  # Excel is 1-based
+    while col_index > 0:
+        col_index -= 1
+        result = chr(65 + (col_index % 26)) + result
+        col_index //= 26
+    return result
+
+
+# Letters for every worksheet column, built once at import
+_COLUMN_LETTERS = tuple(_compute_column_letter(i) for i in range(MAX_EXCEL_COLUMNS))
+
+
+def column_letter(col_index: int) -> str:
+    """Convert column index to Excel letter (supports AA, AB, etc).
+
+    Args:
+        col_index: Zero-based column index
+
+    Returns:
+        Excel column letter (A, B, ..., Z, AA, AB, ...)
+    """
+    if 0 <= col_index < MAX_EXCEL_COLUMNS:
+        return _COLUMN_LETTERS[col_index]
+    return _compute_column_letter(col_index)
+
 
 class FormulaGenerator:
     """Generates Excel formulas from operations and filters."""
@@ -160,13 +192,7 @@ class FormulaGenerator:
         Returns:
             Excel column letter (A, B, ..., Z, AA, AB, ...)
         """
-        result = ""
-        col_index += 1  # Excel is 1-based
-        while col_index > 0:
-            col_index -= 1
-            result = chr(65 + (col_index % 26)) + result
-            col_index //= 26
-        return result
+        return column_letter(col_index)
 
     def _get_column_range(self, column_name: str, column_index: int) -> str:
         """Get Excel range for a column.
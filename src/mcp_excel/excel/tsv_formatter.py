@@ -5,6 +5,7 @@
 
 """TSV formatter for Excel copy-paste functionality."""
 
+from collections.abc import Callable, Iterable, Sequence
 from typing import Any
 
 
@@ -12,13 +13,18 @@ class TSVFormatter:
     """Formats data as TSV for Excel copy-paste."""
 
     def format_table(
-        self, headers: list[str], rows: list[list[Any]]
+        self,
+        headers: list[str],
+        rows: Iterable[Sequence[Any]],
+        float_format: str | None = None,
     ) -> str:
         """Format data as TSV table.
 
         Args:
             headers: Column headers
-            rows: Data rows
+            rows: Data rows (any iterable, e.g. a generator - consumed once)
+            float_format: Optional %-format for float cells (e.g. "%.4f"),
+                replaces rounding values before formatting
 
         Returns:
             TSV-formatted string
@@ -28,12 +34,45 @@ class TSVFormatter:
         # Add headers
         lines.append("\t".join(str(h) for h in headers))
 
+        format_cell: Callable[[Any], str] = self._format_cell
+        if float_format is not None:
+            def format_float_cell(cell: Any) -> str:
+                if isinstance(cell, float):
+                    return float_format % cell
+                return self._format_cell(cell)
+
+            format_cell = format_float_cell
+
         # Add rows
         for row in rows:
-            lines.append("\t".join(self._format_cell(cell) for cell in row))
+            lines.append("\t".join(format_cell(cell) for cell in row))
 
         return "\n".join(lines)
 
+    def format_columns(
+        self,
+        headers: list[str],
+        columns: Sequence[Sequence[Any]],
+    ) -> str:
+        """Format column-oriented data as TSV table.
+
+        Same output as format_table over the zipped columns, but cells are
+        formatted one column at a time and rows are joined without building
+        intermediate row tuples.
+
+        Args:
+            headers: Column headers
+            columns: Column value sequences of equal length
+
+        Returns:
+            TSV-formatted string
+        """
+        format_cell = self._format_cell
+        formatted = [list(map(format_cell, column)) for column in columns]
+
+        header_line = "\t".join(str(h) for h in headers)
+        return "\n".join([header_line, *map("\t".join, zip(*formatted, strict=True))])
+
     def format_single_value(
         self, label: str, value: Any, formula: str | None = None
     ) -> str:
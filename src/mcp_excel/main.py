@@ -1166,17 +1166,17 @@ class MCPExcelServer:
 
                 elif name == "get_column_stats":
                     request = GetColumnStatsRequest(**arguments)
-                    response = self.stats_ops.get_column_stats(request)
+                    response = await self.stats_ops.get_column_stats_async(request)
                     return [TextContent(type="text", text=response.model_dump_json(indent=2))]
 
                 elif name == "correlate":
                     request = CorrelateRequest(**arguments)
-                    response = self.stats_ops.correlate(request)
+                    response = await self.stats_ops.correlate_async(request)
                     return [TextContent(type="text", text=response.model_dump_json(indent=2))]
 
                 elif name == "detect_outliers":
                     request = DetectOutliersRequest(**arguments)
-                    response = self.stats_ops.detect_outliers(request)
+                    response = await self.stats_ops.detect_outliers_async(request)
                     return [TextContent(type="text", text=response.model_dump_json(indent=2))]
 
                 elif name == "search_across_sheets":
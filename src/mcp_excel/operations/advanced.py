@@ -11,7 +11,7 @@ from typing import Optional
 import pandas as pd
 
 from ..core.file_loader import FileLoader
-from ..excel.formula_generator import FormulaGenerator
+from ..excel.formula_generator import column_letter
 from ..excel.tsv_formatter import TSVFormatter
 from ..models.requests import (
     CalculateExpressionRequest,
@@ -67,50 +67,57 @@ class AdvancedOperations(BaseOperations):
         if request.group_by_columns:
             actual_group_by_columns = self._find_columns(df, request.group_by_columns, context="rank_rows")
 
-        # Convert rank column to numeric
-        df[actual_rank_column] = pd.to_numeric(df[actual_rank_column], errors='coerce')
+        # Convert rank column to numeric (skip columns that already are)
+        # Kept as a local Series so the (possibly cached) DataFrame is not modified
+        rank_values = df[actual_rank_column]
+        if not pd.api.types.is_numeric_dtype(rank_values):
+            rank_values = pd.to_numeric(rank_values, errors='coerce')
 
         # Calculate ranks
         ascending = request.direction == "asc"
         
         if actual_group_by_columns:
             # Rank within groups
-            df['rank'] = df.groupby(actual_group_by_columns)[actual_rank_column].rank(
+            ranks = rank_values.groupby([df[col] for col in actual_group_by_columns]).rank(
                 ascending=ascending, method='min'
             )
         else:
             # Global ranking
-            df['rank'] = df[actual_rank_column].rank(ascending=ascending, method='min')
+            ranks = rank_values.rank(ascending=ascending, method='min')
 
-        # Sort by rank
-        df = df.sort_values(by='rank')
+        # Sort by rank: order only the rank column, then take the kept rows
+        # (top_n applied to positions, so discarded rows are never reordered)
+        positions = ranks.reset_index(drop=True).sort_values().index.to_numpy()
 
         # Apply top_n limit if specified
         if request.top_n is not None:
-            df = df.head(request.top_n)
+            positions = positions[:request.top_n]
+
+        # Build the result from the kept rows only (take returns a new frame)
+        df = df.take(positions)
+        df[actual_rank_column] = rank_values.to_numpy()[positions]
+        df['rank'] = ranks.to_numpy()[positions]
 
         # Format results
         result_columns = ['rank'] + list(df.columns[df.columns != 'rank'])
-        rows = []
-        for _, row in df.iterrows():
-            row_dict = {}
-            for col in result_columns:
-                row_dict[col] = self._format_value(row[col])
-            rows.append(row_dict)
+        # Format column-wise; rows and TSV are both built from the columns
+        columns = [self._format_column(df[col]) for col in result_columns]
+        rows = [
+            dict(zip(result_columns, values, strict=True))
+            for values in zip(*columns, strict=True)
+        ]
 
         # Generate TSV
         headers = result_columns
-        tsv_rows = [[row[col] for col in result_columns] for row in rows]
-        tsv = self._tsv_formatter.format_table(headers, tsv_rows)
+        tsv = self._tsv_formatter.format_columns(headers, columns)
 
-        # Generate Excel formula using FormulaGenerator
-        formula_gen = FormulaGenerator(request.sheet_name)
+        # Generate Excel formula (column letters come from the precomputed table)
         column_indices = {str(col): idx for idx, col in enumerate(df.columns)}
         
         # Find rank column index
         rank_col_idx = column_indices.get(actual_rank_column)
         if rank_col_idx is not None:
-            col_letter = formula_gen._column_letter(rank_col_idx)
+            col_letter = column_letter(rank_col_idx)
             # RANK(value, range, order) where order: 0=desc, 1=asc
             order = 1 if ascending else 0
             # Use actual row count for range
@@ -164,6 +171,9 @@ class AdvancedOperations(BaseOperations):
         # Apply filters
         if request.filters:
             df = self._filter_engine.apply_filters(df, request.filters, request.logic)
+        else:
+            # Shallow copy: added/converted columns below stay out of the cached DataFrame
+            df = df.copy(deep=False)
 
         # Find which DataFrame columns are used in the expression
         # Use Unicode normalization to handle NFC/NFD variations
@@ -191,9 +201,10 @@ class AdvancedOperations(BaseOperations):
         # Map back to original column names from DataFrame
         used_columns = [normalized_to_original[col] for col in used_normalized]
 
-        # Convert columns to numeric
+        # Convert columns to numeric (skip columns that already are)
         for col in used_columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+            if not pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col], errors='coerce')
 
         # Build safe expression for pandas.eval()
         # Backtick-quote column names to handle spaces and special chars
@@ -212,20 +223,18 @@ class AdvancedOperations(BaseOperations):
 
         # Format results
         result_columns = list(df.columns)
-        rows = []
-        for _, row in df.iterrows():
-            row_dict = {}
-            for col in result_columns:
-                row_dict[col] = self._format_value(row[col])
-            rows.append(row_dict)
+        # Format column-wise; rows and TSV are both built from the columns
+        columns = [self._format_column(df[col]) for col in result_columns]
+        rows = [
+            dict(zip(result_columns, values, strict=True))
+            for values in zip(*columns, strict=True)
+        ]
 
         # Generate TSV
         headers = result_columns
-        tsv_rows = [[row[col] for col in result_columns] for row in rows]
-        tsv = self._tsv_formatter.format_table(headers, tsv_rows)
+        tsv = self._tsv_formatter.format_columns(headers, columns)
 
-        # Generate Excel formula using FormulaGenerator
-        formula_gen = FormulaGenerator(request.sheet_name)
+        # Generate Excel formula (column letters come from the precomputed table)
         column_indices = {str(col): idx for idx, col in enumerate(df.columns)}
         
         # Convert expression to Excel formula syntax
@@ -234,7 +243,7 @@ class AdvancedOperations(BaseOperations):
         for col in sorted(used_columns, key=len, reverse=True):
             if col in column_indices:
                 col_idx = column_indices[col]
-                col_letter = formula_gen._column_letter(col_idx)
+                col_letter = column_letter(col_idx)
                 excel_formula = excel_formula.replace(col, f"{col_letter}2")
         
         formula = f"={excel_formula}"
@@ -7,13 +7,15 @@
 
 import time
 import unicodedata
+from collections.abc import Callable
 from difflib import get_close_matches
 from typing import Any
 
+import numpy as np
 import pandas as pd
-import psutil
 from pydantic import BaseModel
 
+from ..core.cache import get_process_memory_mb
 from ..core.file_loader import FileLoader
 from ..core.header_detector import HeaderDetector
 from ..models.responses import FileMetadata, PerformanceMetrics
@@ -25,6 +27,54 @@ MAX_ROW_LIMIT = 1000          # Maximum rows per request (hard cap)
 MAX_RESPONSE_CHARS = 15_000   # ~6k tokens for text
 MAX_DIFFERENCES = 500         # Maximum differences in compare_sheets
 
+# Values converted to decide whether a text column is numeric before converting all of it
+NUMERIC_PROBE_SIZE = 10_000
+
+
+def _format_float(value: float) -> Any:
+    """Format Python float: NaN -> None, whole numbers -> int."""
+    if value != value:
+        return None
+    return int(value) if value.is_integer() else value
+
+
+def _format_numpy_float(value: np.floating) -> Any:
+    """Format NumPy float: NaN -> None, otherwise native float."""
+    return None if value != value else value.item()
+
+
+def _format_timestamp(value: pd.Timestamp) -> str:
+    """Format pandas Timestamp as ISO 8601 string."""
+    return str(value.isoformat())
+
+
+def _format_passthrough(value: Any) -> Any:
+    """Return already JSON-serializable value unchanged."""
+    return value
+
+
+def _format_none(value: Any) -> None:
+    """Format missing values (None, NaT, NA) as None."""
+    return None
+
+
+# Exact-type dispatch for the common cell types (see BaseOperations._format_value)
+_VALUE_FORMATTERS: dict[type, Callable[[Any], Any]] = {
+    str: _format_passthrough,
+    int: _format_passthrough,
+    bool: _format_passthrough,
+    float: _format_float,
+    type(None): _format_none,
+    type(pd.NaT): _format_none,
+    type(pd.NA): _format_none,
+    pd.Timestamp: _format_timestamp,
+    np.float64: _format_numpy_float,
+    np.float32: _format_numpy_float,
+    np.int64: np.int64.item,
+    np.int32: np.int32.item,
+    np.bool_: np.bool_.item,
+}
+
 
 class BaseOperations:
     """Base class for all operations with common functionality."""
@@ -53,23 +103,88 @@ class BaseOperations:
         Returns:
             Formatted value (JSON-serializable)
         """
+        # Fast path: one dict lookup on the exact type for common cell types
+        formatter = _VALUE_FORMATTERS.get(type(value))
+        if formatter is not None:
+            return formatter(value)
+
         if pd.isna(value):
             return None
         # Handle numpy scalar types (int8, int16, int32, int64, float32, float64, etc.)
         # All numpy scalars have .item() method to convert to Python native types
         elif hasattr(value, 'item'):
             return value.item()
-        elif isinstance(value, (pd.Timestamp, pd.DatetimeTZDtype)):
+        elif isinstance(value, pd.Timestamp):
             # Convert datetime to ISO 8601 string for agent
             return value.isoformat()
-        elif pd.api.types.is_datetime64_any_dtype(type(value)):
-            # Handle numpy datetime64
-            return pd.Timestamp(value).isoformat()
         elif isinstance(value, float) and value.is_integer():
             return int(value)
         else:
             return value
 
+    def _format_column(self, col_data: pd.Series) -> list[Any]:
+        """Format a whole column for display.
+
+        Same result as _format_value on each value of col_data.tolist() (the
+        native Python values to_dict('records') yields, so whole floats become
+        ints). Works on the underlying NumPy array instead of boxing every cell,
+        so it is much cheaper than a row loop. Object and extension dtypes
+        (nullable Int64/Float64, string, category...) take that per-value path.
+
+        Args:
+            col_data: Column to format
+
+        Returns:
+            List of formatted values (JSON-serializable)
+        """
+        dtype = col_data.dtype
+
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            # Convert datetime to ISO 8601 string for agent, NaT -> None
+            return [None if pd.isna(v) else v.isoformat() for v in col_data]
+
+        if not isinstance(dtype, np.dtype):
+            # Extension dtypes (nullable Int64, category, string...) - generic path
+            return [self._format_value(v) for v in col_data.tolist()]
+
+        if dtype.kind in "iub":
+            # Integers and booleans never hold NaN - tolist() yields native types
+            native: list[Any] = col_data.to_numpy().tolist()
+            return native
+
+        if dtype.kind == "f":
+            values = col_data.to_numpy(dtype=np.float64)
+            result = values.astype(object)
+            # Floats without decimal parts -> ints (vectorized in the int64 range)
+            with np.errstate(invalid="ignore"):
+                whole = np.isfinite(values) & (np.mod(values, 1) == 0)
+            small = whole & (np.abs(values) < 2**63)
+            result[small] = values[small].astype(np.int64).astype(object)
+            large = whole & ~small
+            if large.any():
+                result[large] = [int(v) for v in values[large]]
+            result[np.isnan(values)] = None
+            formatted: list[Any] = result.tolist()
+            return formatted
+
+        return [self._format_value(v) for v in col_data.tolist()]
+
+    def _format_records(self, df: pd.DataFrame) -> list[dict[str, Any]]:
+        """Format DataFrame rows as list of dicts using column-wise formatting.
+
+        Args:
+            df: DataFrame to convert
+
+        Returns:
+            List of row dictionaries with string keys and formatted values
+        """
+        if len(df.columns) == 0:
+            return [{} for _ in range(len(df))]
+
+        keys = [str(col) for col in df.columns]
+        columns = [self._format_column(df.iloc[:, i]) for i in range(len(keys))]
+        return [dict(zip(keys, values, strict=True)) for values in zip(*columns, strict=True)]
+
     def _get_performance_metrics(
         self, start_time: float, rows_processed: int, cache_hit: bool
     ) -> PerformanceMetrics:
@@ -84,14 +199,12 @@ class BaseOperations:
             PerformanceMetrics object
         """
         execution_time = (time.time() - start_time) * 1000
-        process = psutil.Process()
-        memory_mb = process.memory_info().rss / 1024 / 1024
 
         return PerformanceMetrics(
             execution_time_ms=round(execution_time, 2),
             rows_processed=rows_processed,
             cache_hit=cache_hit,
-            memory_used_mb=round(memory_mb, 2),
+            memory_used_mb=round(get_process_memory_mb(), 2),
         )
 
     def _get_file_metadata(
@@ -131,11 +244,23 @@ class BaseOperations:
             df = self._loader.load(file_path, sheet_name, header_row=header_row, use_cache=True)
             detected_row = header_row
         else:
-            df_preview = self._loader.load(file_path, sheet_name, header_row=None, use_cache=True)
-            detection_result = self._header_detector.detect(df_preview)
-            
-            # Always trust the detector - it picks the best candidate from first 20 rows
-            detected_row = detection_result.header_row
+            # The loader remembers detected rows per file version - skips preview load + detection
+            remembered_row = self._loader.get_detected_header(file_path, sheet_name)
+
+            if remembered_row is not None:
+                detected_row = remembered_row
+            else:
+                # Detection only needs the raw parse - skip date conversion (and its
+                # extra workbook open for cell formats) on the header=None view
+                df_preview = self._loader.load(
+                    file_path, sheet_name, header_row=None, use_cache=True, convert_dates=False
+                )
+                detection_result = self._header_detector.detect(df_preview)
+
+                # Always trust the detector - it picks the best candidate from first 20 rows
+                detected_row = detection_result.header_row
+                self._loader.remember_detected_header(file_path, sheet_name, detected_row)
+
             df = self._loader.load(file_path, sheet_name, header_row=detected_row, use_cache=True)
 
         # Normalize column names to strings
@@ -221,6 +346,10 @@ class BaseOperations:
             >>> _find_column(df, "café")  # NFD in request
             "café"  # Returns original NFC name from DataFrame
         """
+        # Fast path: exact name match needs no normalization of every column
+        if column_name in df.columns:
+            return column_name
+
         # Normalize requested column name
         normalized_request = self._normalize_column_name(column_name)
         
@@ -300,43 +429,89 @@ class BaseOperations:
         char_count = len(response_json)
         
         if char_count > MAX_RESPONSE_CHARS:
-            # Build detailed error message following MCP philosophy
-            error_parts = [
-                f"Response too large: {char_count:,} characters (limit: {MAX_RESPONSE_CHARS:,})."
-            ]
-            
-            if rows_count is not None and columns_count is not None:
-                error_parts.append(
-                    f"Current request returned: {rows_count} rows × {columns_count} columns."
-                )
-            
-            # Explain MCP philosophy: agent should not receive raw data
+            self._raise_response_too_large(char_count, rows_count, columns_count, request_limit)
+
+    def _validate_tsv_size(
+        self,
+        tsv: str,
+        rows_count: int | None = None,
+        columns_count: int | None = None,
+    ) -> None:
+        """Fail fast when the TSV output alone exceeds the response limit.
+
+        The serialized response embeds the TSV, so it is at least as long.
+        Checking the TSV before building row dicts and the response model
+        avoids materializing (and serializing) results that would be rejected.
+
+        Args:
+            tsv: TSV output of the response
+            rows_count: Number of rows in response (for better error message)
+            columns_count: Number of columns in response (for better error message)
+
+        Raises:
+            ValueError: If the TSV exceeds safe character limit
+        """
+        if len(tsv) > MAX_RESPONSE_CHARS:
+            self._raise_response_too_large(len(tsv), rows_count, columns_count)
+
+    def _raise_response_too_large(
+        self,
+        char_count: int,
+        rows_count: int | None = None,
+        columns_count: int | None = None,
+        request_limit: int | None = None
+    ) -> None:
+        """Raise the response size error with actionable suggestions.
+
+        Args:
+            char_count: Response size in characters
+            rows_count: Number of rows in response (for better error message)
+            columns_count: Number of columns in response (for better error message)
+            request_limit: Original limit from request (for suggestions)
+
+        Raises:
+            ValueError: Always
+        """
+        # Build detailed error message following MCP philosophy
+        error_parts = [
+            f"Response too large: {char_count:,} characters (limit: {MAX_RESPONSE_CHARS:,})."
+        ]
+        
+        if rows_count is not None and columns_count is not None:
             error_parts.append(
-                "\nMCP Philosophy: Agent should analyze data using atomic operations, not load raw data into context."
+                f"Current request returned: {rows_count} rows × {columns_count} columns."
             )
-            
-            # Provide actionable suggestions
-            error_parts.append("\nHow to fix:")
-            
-            suggestion_num = 1
-            if request_limit is not None and request_limit > DEFAULT_ROW_LIMIT:
-                suggested_limit = max(DEFAULT_ROW_LIMIT, request_limit // 2)
-                error_parts.append(
-                    f"{suggestion_num}) Reduce 'limit' parameter: current={request_limit}, try={suggested_limit}"
-                )
-                suggestion_num += 1
-            
-            if columns_count is not None and columns_count > DEFAULT_COLUMN_LIMIT:
-                error_parts.append(
-                    f"{suggestion_num}) Specify fewer columns: current={columns_count}, default={DEFAULT_COLUMN_LIMIT}"
-                )
-                suggestion_num += 1
-            
+        
+        # Explain MCP philosophy: agent should not receive raw data
+        error_parts.append(
+            "\nMCP Philosophy: Agent should analyze data using atomic operations, "
+            "not load raw data into context."
+        )
+        
+        # Provide actionable suggestions
+        error_parts.append("\nHow to fix:")
+        
+        suggestion_num = 1
+        if request_limit is not None and request_limit > DEFAULT_ROW_LIMIT:
+            suggested_limit = max(DEFAULT_ROW_LIMIT, request_limit // 2)
             error_parts.append(
-                f"{suggestion_num}) Use MCP atomic operations for analysis instead of retrieving rows"
+                f"{suggestion_num}) Reduce 'limit' parameter: "
+                f"current={request_limit}, try={suggested_limit}"
             )
-            
-            raise ValueError(" ".join(error_parts))
+            suggestion_num += 1
+        
+        if columns_count is not None and columns_count > DEFAULT_COLUMN_LIMIT:
+            error_parts.append(
+                f"{suggestion_num}) Specify fewer columns: "
+                f"current={columns_count}, default={DEFAULT_COLUMN_LIMIT}"
+            )
+            suggestion_num += 1
+        
+        error_parts.append(
+            f"{suggestion_num}) Use MCP atomic operations for analysis instead of retrieving rows"
+        )
+        
+        raise ValueError(" ".join(error_parts))
 
     def _apply_column_limit(
         self, 
@@ -401,11 +576,7 @@ class BaseOperations:
         actual_size = min(sample_size, len(df))
         
         # Format values (int instead of float for integers)
-        rows = df.head(actual_size).to_dict('records')
-        return [
-            {k: self._format_value(v) for k, v in row.items()}
-            for row in rows
-        ]
+        return self._format_records(df.head(actual_size))
 
     def _ensure_numeric_column(
         self,
@@ -435,6 +606,18 @@ class BaseOperations:
         
         # Try to convert object/string columns to numeric
         if col_data.dtype == 'object' or col_data.dtype.name == 'string':
+            # Probe a head sample first - clearly non-numeric text columns fail
+            # without converting every row
+            if len(col_data) > NUMERIC_PROBE_SIZE:
+                sample = col_data.dropna().head(NUMERIC_PROBE_SIZE)
+                sample_converted = pd.to_numeric(sample, errors='coerce').notna().sum()
+                if sample_converted < len(sample) * min_conversion_rate:
+                    raise ValueError(
+                        f"Column '{col_name}' is not numeric. "
+                        f"Only {sample_converted}/{len(sample)} sampled values "
+                        f"could be converted to numbers."
+                    )
+
             col_numeric = pd.to_numeric(col_data, errors='coerce')
             non_null_original = col_data.notna().sum()
             non_null_converted = col_numeric.notna().sum()
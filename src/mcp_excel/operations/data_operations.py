@@ -389,12 +389,8 @@ class DataOperations(BaseOperations):
         truncated = total_matches > (request.offset + enforced_limit)
 
         # Convert to list of dicts
-        rows = []
-        for idx in range(len(result_df)):
-            row_dict = result_df.iloc[idx].to_dict()
-            # Convert to JSON-serializable types with string keys and format values
-            row_dict = {str(k): self._format_value(v) for k, v in row_dict.items()}
-            rows.append(row_dict)
+        # Convert to JSON-serializable types with string keys and format values
+        rows = self._format_records(result_df)
 
         # Generate TSV output
         if rows:
@@ -459,7 +455,8 @@ class DataOperations(BaseOperations):
             df = self._filter_engine.apply_filters(df, request.filters, request.logic)
 
         # Store filtered df for sample_rows before aggregation
-        filtered_df_for_samples = df.copy()
+        # (aggregation works on a column Series and never modifies df - no copy needed)
+        filtered_df_for_samples = df
 
         # Get column data
         col_data = df[actual_target_column]
@@ -604,26 +601,29 @@ class DataOperations(BaseOperations):
         operation = request.agg_operation
         
         # Try to convert aggregation column to numeric if needed (only for numeric operations)
+        # Converted into a local Series so the (possibly cached) DataFrame is not modified
+        agg_values = df[actual_agg_column]
         if operation != "count":
-            if df[actual_agg_column].dtype == 'object' or df[actual_agg_column].dtype.name == 'string':
-                df[actual_agg_column] = pd.to_numeric(df[actual_agg_column], errors='coerce')
+            if agg_values.dtype == 'object' or agg_values.dtype.name == 'string':
+                agg_values = pd.to_numeric(agg_values, errors='coerce')
+        grouped_values = agg_values.groupby([df[col] for col in actual_group_columns])
         try:
             if operation == "sum":
-                grouped = df.groupby(actual_group_columns)[actual_agg_column].sum()
+                grouped = grouped_values.sum()
             elif operation == "mean":
-                grouped = df.groupby(actual_group_columns)[actual_agg_column].mean()
+                grouped = grouped_values.mean()
             elif operation == "median":
-                grouped = df.groupby(actual_group_columns)[actual_agg_column].median()
+                grouped = grouped_values.median()
             elif operation == "min":
-                grouped = df.groupby(actual_group_columns)[actual_agg_column].min()
+                grouped = grouped_values.min()
             elif operation == "max":
-                grouped = df.groupby(actual_group_columns)[actual_agg_column].max()
+                grouped = grouped_values.max()
             elif operation == "std":
-                grouped = df.groupby(actual_group_columns)[actual_agg_column].std()
+                grouped = grouped_values.std()
             elif operation == "var":
-                grouped = df.groupby(actual_group_columns)[actual_agg_column].var()
+                grouped = grouped_values.var()
             elif operation == "count":
-                grouped = df.groupby(actual_group_columns)[actual_agg_column].count()
+                grouped = grouped_values.count()
             else:
                 raise ValueError(f"Unsupported operation: {operation}")
         except (TypeError, ValueError, KeyError) as e:
@@ -642,12 +642,8 @@ class DataOperations(BaseOperations):
             # For DataFrame (shouldn't happen with single agg column, but handle it)
             grouped_df = grouped.reset_index()
         
-        groups = []
-        for idx in range(len(grouped_df)):
-            row_dict = grouped_df.iloc[idx].to_dict()
-            # Convert to JSON-serializable types with string keys and format values
-            formatted_dict = {str(k): self._format_value(v) for k, v in row_dict.items()}
-            groups.append(formatted_dict)
+        # Convert to JSON-serializable types with string keys and format values
+        groups = self._format_records(grouped_df)
 
         # Generate TSV output
         if groups:
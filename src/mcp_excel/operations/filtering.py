@@ -95,6 +95,31 @@ class FilterEngine:
         if not filters:
             return df
 
+        # Return explicit copy for clear ownership (architectural principle)
+        return df[self.build_mask(df, filters, logic)].copy()
+
+    def build_mask(
+        self,
+        df: pd.DataFrame,
+        filters: list[FilterCondition | FilterGroup],
+        logic: str = "AND",
+    ) -> pd.Series:
+        """Build combined boolean mask for filters without selecting rows.
+
+        Lets callers that only need a few columns select them together with
+        the filtered rows, instead of copying the whole filtered DataFrame.
+
+        Args:
+            df: DataFrame to filter
+            filters: List of filter conditions or nested groups (non-empty)
+            logic: Logic operator ("AND" or "OR")
+
+        Returns:
+            Boolean Series mask aligned with df
+
+        Raises:
+            ValueError: If filter is invalid
+        """
         # Build mask for each filter (may be condition or group)
         masks = []
         for filter_item in filters:
@@ -121,8 +146,7 @@ class FilterEngine:
         else:
             raise ValueError(f"Invalid logic operator: {logic}. Must be 'AND' or 'OR'")
 
-        # Return explicit copy for clear ownership (architectural principle)
-        return df[combined_mask].copy()
+        return combined_mask
 
     def count_filtered(
         self,
@@ -143,29 +167,7 @@ class FilterEngine:
         if not filters:
             return len(df)
 
-        masks = []
-        for filter_item in filters:
-            if isinstance(filter_item, FilterCondition):
-                # Atomic condition
-                mask = self._build_filter_mask(df, filter_item)
-            elif isinstance(filter_item, FilterGroup):
-                # Nested group - RECURSION
-                mask = self._build_group_mask(df, filter_item)
-            else:
-                raise ValueError(f"Invalid filter type: {type(filter_item)}")
-            
-            masks.append(mask)
-
-        if logic == "AND":
-            combined_mask = masks[0]
-            for mask in masks[1:]:
-                combined_mask = combined_mask & mask
-        else:
-            combined_mask = masks[0]
-            for mask in masks[1:]:
-                combined_mask = combined_mask | mask
-
-        return int(combined_mask.sum())
+        return int(self.build_mask(df, filters, logic).sum())
 
     def _build_group_mask(
         self,
@@ -6,10 +6,13 @@
 """Inspection operations for Excel files."""
 
 import time
+from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from ..core.file_loader import FileLoader
+from ..excel.tsv_formatter import TSVFormatter
 from ..models.requests import (
     CompareSheetsRequest,
     FindColumnRequest,
@@ -34,6 +37,9 @@ from ..models.responses import (
 )
 from ..operations.base import BaseOperations, MAX_DIFFERENCES
 
+# compare_sheets row status, indexed by status code
+COMPARE_STATUSES = ["only_in_sheet1", "only_in_sheet2", "different_values"]
+
 
 class InspectionOperations(BaseOperations):
     """Operations for inspecting Excel file structure."""
@@ -45,6 +51,23 @@ class InspectionOperations(BaseOperations):
             file_loader: FileLoader instance for loading files
         """
         super().__init__(file_loader)
+        self._tsv_formatter = TSVFormatter()
+
+    def _match_columns(self, df: pd.DataFrame, column_name: str) -> list[tuple[int, str]]:
+        """Find columns whose name matches case-insensitively.
+
+        Args:
+            df: DataFrame to search in
+            column_name: Requested column name
+
+        Returns:
+            List of (column_index, column_name) in column order
+        """
+        target = column_name.casefold()
+        return [
+            (idx, str(col)) for idx, col in enumerate(df.columns)
+            if str(col).casefold() == target
+        ]
 
     def inspect_file(self, request: InspectFileRequest) -> InspectFileResponse:
         """Inspect Excel file structure.
@@ -65,7 +88,10 @@ class InspectionOperations(BaseOperations):
 
         for sheet_name in file_info["sheet_names"]:
             try:
-                df = self._loader.load(request.file_path, sheet_name, header_row=None)
+                # Only the shape is needed - the raw parse skips date conversion
+                df = self._loader.load(
+                    request.file_path, sheet_name, header_row=None, convert_dates=False
+                )
                 row_count = len(df)
                 col_count = len(df.columns)
                 total_rows += row_count
@@ -106,16 +132,15 @@ class InspectionOperations(BaseOperations):
         """
         start_time = time.time()
 
-        # Load without header first for detection
-        df_raw = self._loader.load(
-            request.file_path, request.sheet_name, header_row=None, use_cache=True
-        )
-
         header_detection_info = None
         header_row = request.header_row
 
-        # Auto-detect header if not specified
+        # Auto-detect header if not specified (raw load only needed for detection)
         if header_row is None:
+            df_raw = self._loader.load(
+                request.file_path, request.sheet_name,
+                header_row=None, use_cache=True, convert_dates=False,
+            )
             detection_result = self._header_detector.detect(df_raw)
             header_row = detection_result.header_row
             header_detection_info = HeaderDetectionInfo(
@@ -144,14 +169,9 @@ class InspectionOperations(BaseOperations):
             else:
                 column_types[str(col)] = "string"
 
-        # Get sample rows
-        sample_rows = []
-        for idx in range(min(3, len(df))):
-            row_dict = df.iloc[idx].to_dict()
-            # Convert to JSON-serializable types with string keys and format values
-            # Use _format_value() to handle numpy types, datetime, and other conversions
-            serialized_row = {str(k): self._format_value(v) for k, v in row_dict.items()}
-            sample_rows.append(serialized_row)
+        # Get sample rows (formatted column-wise: NaN masking and datetime
+        # conversion done per column instead of per cell)
+        sample_rows = self._format_records(df.head(3))
 
         metadata = self._get_file_metadata(request.file_path, request.sheet_name)
         metadata.rows_total = len(df)
@@ -183,13 +203,13 @@ class InspectionOperations(BaseOperations):
         """
         start_time = time.time()
 
-        # Load with header detection
-        df_raw = self._loader.load(
-            request.file_path, request.sheet_name, header_row=None, use_cache=True
-        )
-
+        # Auto-detect header if not specified (raw load only needed for detection)
         header_row = request.header_row
         if header_row is None:
+            df_raw = self._loader.load(
+                request.file_path, request.sheet_name,
+                header_row=None, use_cache=True, convert_dates=False,
+            )
             detection_result = self._header_detector.detect(df_raw)
             header_row = detection_result.header_row
 
@@ -230,20 +250,15 @@ class InspectionOperations(BaseOperations):
 
         for sheet_name in sheets_to_search:
             try:
-                # Load with header detection
-                df_raw = self._loader.load(request.file_path, sheet_name, header_row=None, use_cache=True)
-                detection_result = self._header_detector.detect(df_raw)
-                df = self._loader.load(request.file_path, sheet_name, header_row=detection_result.header_row, use_cache=True)
+                # Load with header detection (detected row is memoized per file/sheet)
+                df, header_row = self._load_with_header_detection(
+                    request.file_path, sheet_name, None
+                )
                 
                 total_rows += len(df)
 
                 # Check if column exists (case-insensitive)
-                column_names = [str(col) for col in df.columns]
-                matching_cols = [
-                    (idx, col)
-                    for idx, col in enumerate(column_names)
-                    if col.lower() == request.column_name.lower()
-                ]
+                matching_cols = self._match_columns(df, request.column_name)
 
                 if matching_cols:
                     for col_idx, col_name in matching_cols:
@@ -287,30 +302,34 @@ class InspectionOperations(BaseOperations):
 
         for sheet_name in file_info["sheet_names"]:
             try:
-                # Load with header detection
-                df_raw = self._loader.load(request.file_path, sheet_name, header_row=None, use_cache=True)
-                detection_result = self._header_detector.detect(df_raw)
-                df = self._loader.load(request.file_path, sheet_name, header_row=detection_result.header_row, use_cache=True)
+                # Load with header detection (detected row is memoized per file/sheet)
+                df, header_row = self._load_with_header_detection(
+                    request.file_path, sheet_name, None
+                )
                 
                 total_rows += len(df)
 
-                # Check if column exists (case-insensitive)
-                column_names = [str(col) for col in df.columns]
-                matching_col = None
-                for col in column_names:
-                    if col.lower() == request.column_name.lower():
-                        matching_col = col
-                        break
+                # Check if column exists (case-insensitive, first match wins)
+                matching_cols = self._match_columns(df, request.column_name)
+                matching_col = matching_cols[0][1] if matching_cols else None
 
                 if matching_col:
                     # Count matches in this column
-                    if pd.api.types.is_numeric_dtype(df[matching_col]):
+                    col_data = df[matching_col]
+                    if pd.api.types.is_numeric_dtype(col_data):
                         # Numeric comparison
-                        match_count = int((df[matching_col] == request.value).sum())
+                        if isinstance(col_data.dtype, np.dtype):
+                            # Plain NumPy column: one ufunc pass, no Series/index overhead
+                            match_count = int(
+                                np.count_nonzero(col_data.to_numpy() == request.value)
+                            )
+                        else:
+                            # Nullable extension dtypes (pd.NA) need pandas semantics
+                            match_count = int((col_data == request.value).sum())
                     else:
                         # String comparison (case-insensitive)
                         match_count = int(
-                            df[matching_col]
+                            col_data
                             .astype(str)
                             .str.lower()
                             .eq(str(request.value).lower())
@@ -354,16 +373,13 @@ class InspectionOperations(BaseOperations):
         """
         start_time = time.time()
 
-        # Load both sheets with header detection
-        df1_raw = self._loader.load(
-            request.file_path, request.sheet1, header_row=None, use_cache=True
-        )
-        df2_raw = self._loader.load(
-            request.file_path, request.sheet2, header_row=None, use_cache=True
-        )
-
+        # Detect header on the first sheet if not specified (applies to both sheets)
         header_row = request.header_row
         if header_row is None:
+            df1_raw = self._loader.load(
+                request.file_path, request.sheet1,
+                header_row=None, use_cache=True, convert_dates=False,
+            )
             detection_result = self._header_detector.detect(df1_raw)
             header_row = detection_result.header_row
 
@@ -410,65 +426,85 @@ class InspectionOperations(BaseOperations):
             indicator=True,
         )
 
-        # Find differences (with limit to prevent context overflow)
+        # Classify merged rows with vectorized masks (no per-row iterrows)
+        n_rows = len(merged)
+        left_only = (merged["_merge"] == "left_only").to_numpy()
+        right_only = (merged["_merge"] == "right_only").to_numpy()
+        in_both = ~(left_only | right_only)
+
+        # Per compare column: suffixed column names and "values differ" mask
+        compare_specs = []
+        any_value_diff = np.zeros(n_rows, dtype=bool)
+        for col in request.compare_columns:
+            col1, col2 = f"{col}_sheet1", f"{col}_sheet2"
+            if col1 in merged.columns and col2 in merged.columns:
+                val1, val2 = merged[col1], merged[col2]
+                na1 = val1.isna().to_numpy()
+                na2 = val2.isna().to_numpy()
+                # NaN on both sides is equal; NaN on one side or unequal values differ
+                value_diff = in_both & ~(na1 & na2) & (na1 | na2 | (val1 != val2).to_numpy())
+            else:
+                # Not suffixed (e.g. the key column itself) - never differs
+                na1 = na2 = value_diff = np.zeros(n_rows, dtype=bool)
+            compare_specs.append((col1, col2, na1, na2, value_diff))
+            any_value_diff |= value_diff
+
+        status_codes = np.select(
+            [left_only, right_only, any_value_diff], [0, 1, 2], default=-1
+        )
+
+        # CONTEXT OVERFLOW PROTECTION: Only materialize the first MAX_DIFFERENCES rows
+        diff_positions = np.flatnonzero(status_codes >= 0)
+        truncated = len(diff_positions) > MAX_DIFFERENCES
+        diff_positions = diff_positions[:MAX_DIFFERENCES]
+
+        def _values_at(col_name: str) -> list[Any]:
+            if col_name not in merged.columns:
+                return [None] * len(diff_positions)
+            values: list[Any] = merged[col_name].iloc[diff_positions].tolist()
+            return values
+
+        key_values = _values_at(request.key_column)
+        column_values = [
+            (col1, col2, _values_at(col1), _values_at(col2), na1, na2, value_diff)
+            for col1, col2, na1, na2, value_diff in compare_specs
+        ]
+
         differences = []
-        truncated = False
-        
-        for _, row in merged.iterrows():
-            # CONTEXT OVERFLOW PROTECTION: Stop if we hit the limit
-            if len(differences) >= MAX_DIFFERENCES:
-                truncated = True
-                break
-                
-            diff_entry = {request.key_column: row[request.key_column]}
-
-            # Check if row exists in both sheets
-            if row["_merge"] == "left_only":
-                diff_entry["status"] = "only_in_sheet1"
-                for col in request.compare_columns:
-                    diff_entry[f"{col}_sheet1"] = row.get(f"{col}_sheet1")
-                    diff_entry[f"{col}_sheet2"] = None
-                differences.append(diff_entry)
-            elif row["_merge"] == "right_only":
-                diff_entry["status"] = "only_in_sheet2"
-                for col in request.compare_columns:
-                    diff_entry[f"{col}_sheet1"] = None
-                    diff_entry[f"{col}_sheet2"] = row.get(f"{col}_sheet2")
-                differences.append(diff_entry)
+        for i, pos in enumerate(diff_positions):
+            diff_entry = {request.key_column: key_values[i]}
+            code = int(status_codes[pos])
+
+            if code == 0:
+                diff_entry["status"] = COMPARE_STATUSES[code]
+                for col1, col2, values1, _, _, _, _ in column_values:
+                    diff_entry[col1] = values1[i]
+                    diff_entry[col2] = None
+            elif code == 1:
+                diff_entry["status"] = COMPARE_STATUSES[code]
+                for col1, col2, _, values2, _, _, _ in column_values:
+                    diff_entry[col1] = None
+                    diff_entry[col2] = values2[i]
             else:
-                # Row exists in both - check for value differences
-                has_diff = False
-                for col in request.compare_columns:
-                    val1 = row.get(f"{col}_sheet1")
-                    val2 = row.get(f"{col}_sheet2")
-
-                    # Handle NaN comparison
-                    if pd.isna(val1) and pd.isna(val2):
-                        continue
-                    if pd.isna(val1) or pd.isna(val2) or val1 != val2:
-                        has_diff = True
-                        diff_entry[f"{col}_sheet1"] = None if pd.isna(val1) else val1
-                        diff_entry[f"{col}_sheet2"] = None if pd.isna(val2) else val2
-
-                if has_diff:
-                    diff_entry["status"] = "different_values"
-                    differences.append(diff_entry)
+                # Row exists in both - only differing columns are reported
+                for col1, col2, values1, values2, na1, na2, value_diff in column_values:
+                    if value_diff[pos]:
+                        diff_entry[col1] = None if na1[pos] else values1[i]
+                        diff_entry[col2] = None if na2[pos] else values2[i]
+                diff_entry["status"] = COMPARE_STATUSES[code]
 
-        # Generate TSV output
-        from ..excel.tsv_formatter import TSVFormatter
+            differences.append(diff_entry)
 
-        tsv_formatter = TSVFormatter()
+        # Generate TSV output
         if differences:
             headers = [request.key_column, "status"]
             for col in request.compare_columns:
                 headers.extend([f"{col}_sheet1", f"{col}_sheet2"])
 
-            rows = []
-            for diff in differences:
-                row = [diff.get(h) for h in headers]
-                rows.append(row)
-
-            tsv = tsv_formatter.format_table(headers, rows)
+            # Stream rows straight from differences (no intermediate list-of-lists)
+            tsv = self._tsv_formatter.format_table(
+                headers, ([diff.get(h) for h in headers] for diff in differences)
+            )
             
             # Add truncation warning if needed
             if truncated:
@@ -564,15 +600,19 @@ class InspectionOperations(BaseOperations):
             if data_type in ["integer", "float"]:
                 non_null_data = col_data.dropna()
                 if len(non_null_data) > 0:
+                    # One partition for all three order statistics
+                    q25, median, q75 = np.quantile(
+                        non_null_data.to_numpy(dtype=np.float64), [0.25, 0.5, 0.75]
+                    )
                     stats = ColumnStats(
                         count=int(len(non_null_data)),
                         mean=float(non_null_data.mean()),
-                        median=float(non_null_data.median()),
+                        median=float(median),
                         std=float(non_null_data.std()) if len(non_null_data) > 1 else 0.0,
                         min=self._format_value(non_null_data.min()),
                         max=self._format_value(non_null_data.max()),
-                        q25=float(non_null_data.quantile(0.25)),
-                        q75=float(non_null_data.quantile(0.75)),
+                        q25=float(q25),
+                        q75=float(q75),
                         null_count=null_count,
                     )
 
@@ -618,9 +658,7 @@ class InspectionOperations(BaseOperations):
                 top_count,
             ])
 
-        from ..excel.tsv_formatter import TSVFormatter
-        tsv_formatter = TSVFormatter()
-        tsv = tsv_formatter.format_table(tsv_rows[0], tsv_rows[1:])
+        tsv = self._tsv_formatter.format_table(tsv_rows[0], tsv_rows[1:])
 
         excel_output = ExcelOutput(tsv=tsv, formula=None, references=None)
 
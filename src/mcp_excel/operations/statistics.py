@@ -5,8 +5,14 @@
 
 """Statistical operations for Excel data analysis."""
 
+import asyncio
+import os
+import threading
 import time
+from collections import OrderedDict
+from typing import TypeVar
 
+import numpy as np
 import pandas as pd
 
 from ..core.file_loader import FileLoader
@@ -26,6 +32,66 @@ from ..models.responses import (
 from ..operations.base import BaseOperations
 from ..operations.filtering import FilterEngine
 
+# Maximum number of statistics responses kept for repeated identical requests
+MAX_STATS_CACHE_ENTRIES = 64
+
+# Requests and responses that go through the statistics result cache
+StatsRequest = GetColumnStatsRequest | CorrelateRequest | DetectOutliersRequest
+StatsResponse = GetColumnStatsResponse | CorrelateResponse | DetectOutliersResponse
+# (request type, request JSON, file mtime, loader cache version)
+StatsCacheKey = tuple[str, str, int, int]
+StatsResponseT = TypeVar(
+    "StatsResponseT", GetColumnStatsResponse, CorrelateResponse, DetectOutliersResponse
+)
+
+
+def _iqr_mask(col_values: np.ndarray, values: np.ndarray, threshold: float) -> np.ndarray:
+    """Flag values outside [Q1 - threshold*IQR, Q3 + threshold*IQR].
+
+    Args:
+        col_values: Full column as float64 (NaN for missing)
+        values: Non-null column values
+        threshold: IQR multiplier
+
+    Returns:
+        Boolean outlier mask aligned with col_values
+    """
+    # Single partition-based pass for both quartiles
+    q1, q3 = np.quantile(values, [0.25, 0.75], method="linear")
+    iqr = q3 - q1
+    lower_bound = q1 - threshold * iqr
+    upper_bound = q3 + threshold * iqr
+    mask: np.ndarray = (col_values < lower_bound) | (col_values > upper_bound)
+    return mask
+
+
+def _zscore_mask(col_values: np.ndarray, values: np.ndarray, threshold: float) -> np.ndarray:
+    """Flag values whose absolute Z-score exceeds threshold.
+
+    Args:
+        col_values: Full column as float64 (NaN for missing)
+        values: Non-null column values
+        threshold: Z-score threshold
+
+    Returns:
+        Boolean outlier mask aligned with col_values
+
+    Raises:
+        ValueError: If standard deviation is 0
+    """
+    mean = values.mean()
+    std = values.std(ddof=1)
+
+    if std == 0:
+        raise ValueError("Standard deviation is 0, cannot use Z-score method")
+
+    # Z-scores computed in place in one scratch buffer
+    z_scores = col_values - mean
+    np.abs(z_scores, out=z_scores)
+    z_scores /= std
+    mask: np.ndarray = z_scores > threshold
+    return mask
+
 
 class StatisticsOperations(BaseOperations):
     """Statistical analysis operations for Excel data."""
@@ -39,6 +105,168 @@ class StatisticsOperations(BaseOperations):
         super().__init__(file_loader)
         self._filter_engine = FilterEngine()
         self._tsv_formatter = TSVFormatter()
+        # Responses per StatsCacheKey - LRU order. The loader cache version makes
+        # FileLoader.invalidate_cache()/clear_cache() drop stale results too.
+        # The *_async methods run in worker threads, so access goes through the lock
+        self._stats_cache: OrderedDict[StatsCacheKey, StatsResponse] = OrderedDict()
+        self._stats_cache_lock = threading.Lock()
+
+    def _stats_cache_key(self, request: StatsRequest) -> StatsCacheKey | None:
+        """Build result cache key for a statistics request.
+
+        Args:
+            request: Statistics request (must have file_path)
+
+        Returns:
+            Cache key, or None if the file can't be stat'ed (loader reports the error)
+        """
+        try:
+            mtime_ns = os.stat(request.file_path).st_mtime_ns
+        except OSError:
+            return None
+        return (
+            type(request).__name__,
+            request.model_dump_json(),
+            mtime_ns,
+            self._loader.get_cache_version(),
+        )
+
+    def _get_cached_stats(
+        self,
+        cache_key: StatsCacheKey | None,
+        start_time: float,
+        response_type: type[StatsResponseT],
+    ) -> StatsResponseT | None:
+        """Return cached response with fresh performance metrics, if present.
+
+        Args:
+            cache_key: Key from _stats_cache_key
+            start_time: Operation start time
+            response_type: Expected response model (the key includes the request type)
+
+        Returns:
+            Copy of cached response (cache_hit=True) or None
+        """
+        if cache_key is None:
+            return None
+
+        with self._stats_cache_lock:
+            cached = self._stats_cache.get(cache_key)
+            if not isinstance(cached, response_type):
+                return None
+            self._stats_cache.move_to_end(cache_key)
+
+        performance = self._get_performance_metrics(
+            start_time, cached.performance.rows_processed, True
+        )
+        return cached.model_copy(deep=True, update={"performance": performance})
+
+    def _put_cached_stats(
+        self, cache_key: StatsCacheKey | None, response: StatsResponse
+    ) -> None:
+        """Store response in the statistics result cache.
+
+        Args:
+            cache_key: Key from _stats_cache_key
+            response: Response to cache (a deep copy is stored)
+        """
+        if cache_key is None:
+            return
+        cached = response.model_copy(deep=True)
+        with self._stats_cache_lock:
+            self._stats_cache[cache_key] = cached
+            # Drop the least recently used entry to keep memory bounded
+            if len(self._stats_cache) > MAX_STATS_CACHE_ENTRIES:
+                self._stats_cache.popitem(last=False)
+
+    async def get_column_stats_async(
+        self, request: GetColumnStatsRequest
+    ) -> GetColumnStatsResponse:
+        """Run get_column_stats in a worker thread (keeps event loop responsive).
+
+        Args:
+            request: GetColumnStatsRequest with parameters
+
+        Returns:
+            GetColumnStatsResponse with statistics
+        """
+        return await asyncio.to_thread(self.get_column_stats, request)
+
+    async def correlate_async(self, request: CorrelateRequest) -> CorrelateResponse:
+        """Run correlate in a worker thread (keeps event loop responsive).
+
+        Args:
+            request: CorrelateRequest with parameters
+
+        Returns:
+            CorrelateResponse with correlation matrix
+        """
+        return await asyncio.to_thread(self.correlate, request)
+
+    async def detect_outliers_async(
+        self, request: DetectOutliersRequest
+    ) -> DetectOutliersResponse:
+        """Run detect_outliers in a worker thread (keeps event loop responsive).
+
+        Args:
+            request: DetectOutliersRequest with parameters
+
+        Returns:
+            DetectOutliersResponse with outlier information
+        """
+        return await asyncio.to_thread(self.detect_outliers, request)
+
+    def _compute_stats_numpy(self, col_data: pd.Series, column: str) -> ColumnStats:
+        """Compute column statistics from one float64 array.
+
+        Replaces separate pandas reductions (each re-checking dtype and NaN)
+        with one extraction, one NaN mask and one quantile partition.
+
+        Args:
+            col_data: Numeric column data
+            column: Column name for error messages
+
+        Returns:
+            ColumnStats for the column
+
+        Raises:
+            ValueError: If column has no non-null values
+        """
+        is_extension = not isinstance(col_data.dtype, np.dtype)
+        if is_extension:
+            arr = col_data.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            arr = col_data.to_numpy(dtype=np.float64, copy=False)
+
+        # Integer/bool columns cannot hold NaN - use the array as-is
+        clean = arr if not is_extension and col_data.dtype.kind in "iub" else arr[~np.isnan(arr)]
+        null_count = int(len(arr) - len(clean))
+
+        if len(clean) == 0:
+            raise ValueError(f"Column '{column}' has no non-null numeric values")
+
+        q25, median, q75 = np.quantile(clean, [0.25, 0.5, 0.75])
+
+        # Min/max keep the column's own type (int stays int, bool stays bool)
+        if is_extension:
+            min_value, max_value = col_data.min(), col_data.max()
+        elif col_data.dtype.kind == "f":
+            min_value, max_value = clean.min(), clean.max()
+        else:
+            native = col_data.to_numpy()
+            min_value, max_value = native.min(), native.max()
+
+        return ColumnStats(
+            count=int(len(clean)),
+            mean=float(clean.mean()),
+            median=float(median),
+            std=float(clean.std(ddof=1)) if len(clean) > 1 else None,
+            min=self._format_value(min_value),
+            max=self._format_value(max_value),
+            q25=float(q25),
+            q75=float(q75),
+            null_count=null_count,
+        )
 
     def get_column_stats(self, request: GetColumnStatsRequest) -> GetColumnStatsResponse:
         """Get statistical summary of a column.
@@ -54,6 +282,12 @@ class StatisticsOperations(BaseOperations):
         """
         start_time = time.time()
 
+        # Identical request on an unchanged file - serve the previous result
+        cache_key = self._stats_cache_key(request)
+        cached = self._get_cached_stats(cache_key, start_time, GetColumnStatsResponse)
+        if cached is not None:
+            return cached
+
         # Load data
         df, header_row = self._load_with_header_detection(
             request.file_path, request.sheet_name, request.header_row
@@ -65,34 +299,16 @@ class StatisticsOperations(BaseOperations):
         # Apply filters if provided
         if request.filters:
             df = self._filter_engine.apply_filters(df, request.filters, request.logic)
+        n_rows, n_cols = df.shape
 
-        # Store filtered df for sample_rows
-        filtered_df_for_samples = df.copy()
-
-        # Get column data
+        # Get column data (df is only read below, so it doubles as sample_rows source)
         col_data = df[actual_column]
 
         # Ensure column is numeric (with auto-conversion for text-stored numbers)
         col_data = self._ensure_numeric_column(col_data, request.column)
 
-        # Calculate statistics
-        null_count = int(col_data.isna().sum())
-        non_null_data = col_data.dropna()
-
-        if len(non_null_data) == 0:
-            raise ValueError(f"Column '{request.column}' has no non-null numeric values")
-
-        stats = ColumnStats(
-            count=int(len(non_null_data)),
-            mean=float(non_null_data.mean()),
-            median=float(non_null_data.median()),
-            std=float(non_null_data.std()) if len(non_null_data) > 1 else None,
-            min=self._format_value(non_null_data.min()),
-            max=self._format_value(non_null_data.max()),
-            q25=float(non_null_data.quantile(0.25)),
-            q75=float(non_null_data.quantile(0.75)),
-            null_count=null_count,
-        )
+        # Calculate statistics (single NumPy pass over the column)
+        stats = self._compute_stats_numpy(col_data, request.column)
 
         # Generate TSV output
         headers = ["Statistic", "Value"]
@@ -113,14 +329,14 @@ class StatisticsOperations(BaseOperations):
 
         # Create response
         metadata = self._get_file_metadata(request.file_path, request.sheet_name)
-        metadata.rows_total = len(df)
-        metadata.columns_total = len(df.columns)
+        metadata.rows_total = n_rows
+        metadata.columns_total = n_cols
 
-        performance = self._get_performance_metrics(start_time, len(df), False)
+        performance = self._get_performance_metrics(start_time, n_rows, False)
 
-        sample_rows_data = self._add_sample_rows(filtered_df_for_samples, request.sample_rows)
+        sample_rows_data = self._add_sample_rows(df, request.sample_rows)
 
-        return GetColumnStatsResponse(
+        response = GetColumnStatsResponse(
             column=request.column,
             stats=stats,
             excel_output=excel_output,
@@ -128,6 +344,9 @@ class StatisticsOperations(BaseOperations):
             metadata=metadata,
             performance=performance,
         )
+        self._put_cached_stats(cache_key, response)
+
+        return response
 
     def correlate(self, request: CorrelateRequest) -> CorrelateResponse:
         """Calculate correlation between columns.
@@ -143,6 +362,12 @@ class StatisticsOperations(BaseOperations):
         """
         start_time = time.time()
 
+        # Identical request on an unchanged file - serve the previous result
+        cache_key = self._stats_cache_key(request)
+        cached = self._get_cached_stats(cache_key, start_time, CorrelateResponse)
+        if cached is not None:
+            return cached
+
         # Validate minimum columns
         if len(request.columns) < 2:
             raise ValueError("At least 2 columns are required for correlation analysis")
@@ -158,54 +383,66 @@ class StatisticsOperations(BaseOperations):
         # Apply filters if provided
         if request.filters:
             df = self._filter_engine.apply_filters(df, request.filters, request.logic)
-
-        # Select only requested columns
-        df_subset = df[actual_columns].copy()
+        n_rows, n_cols = df.shape
 
         # Ensure all columns are numeric (with auto-conversion for text-stored numbers)
-        for col in actual_columns:
-            df_subset[col] = self._ensure_numeric_column(df_subset[col], col)
+        # and build the subset once from the Series - no intermediate selection copy.
+        # Keyed by position so repeated columns are kept (matrix is positional)
+        columns = [df[col] for col in actual_columns]
+        for i, col_data in enumerate(columns):
+            if not pd.api.types.is_numeric_dtype(col_data):
+                columns[i] = self._ensure_numeric_column(col_data, actual_columns[i])
+
+        df_subset = pd.DataFrame(dict(enumerate(columns)), copy=False)
 
-        # Drop rows with any NaN values
-        df_clean = df_subset.dropna()
+        # One float64 matrix; rows with any NaN are dropped by mask (no dropna copy)
+        values = df_subset.to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[~np.isnan(values).any(axis=1)]
+        rows_clean = len(values)
 
-        if len(df_clean) < 2:
+        if rows_clean < 2:
             raise ValueError(
                 f"Not enough data for correlation analysis. "
-                f"Only {len(df_clean)} rows remain after removing nulls (minimum 2 required)"
+                f"Only {rows_clean} rows remain after removing nulls (minimum 2 required)"
             )
 
         # Calculate correlation matrix
-        corr_matrix = df_clean.corr(method=request.method)
-
-        # Convert to nested dict format
-        correlation_dict = {}
-        for col1 in request.columns:
-            correlation_dict[col1] = {}
-            for col2 in request.columns:
-                correlation_dict[col1][col2] = round(float(corr_matrix.loc[col1, col2]), 4)
-
-        # Generate TSV output (correlation matrix)
+        if request.method == "pearson":
+            # Single BLAS-backed pass, skips DataFrame.corr dispatch
+            # (constant columns yield NaN like pandas - silence the divide warning)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                corr_values = np.corrcoef(values, rowvar=False)
+        else:
+            # Rank-based methods have no direct NumPy equivalent
+            corr_values = pd.DataFrame(values).corr(method=request.method).to_numpy()
+
+        # Round once, then build dict from plain lists
+        # (positional - matrix follows request.columns order)
+        corr_rows = np.round(corr_values, 4).tolist()
+        correlation_dict = {
+            col1: dict(zip(request.columns, corr_rows[i], strict=True))
+            for i, col1 in enumerate(request.columns)
+        }
+
+        # Generate TSV output (correlation matrix, 4 decimals formatted by the writer)
         headers = [""] + request.columns
-        rows = []
-        for col1 in request.columns:
-            row = [col1]
-            for col2 in request.columns:
-                row.append(round(correlation_dict[col1][col2], 4))
-            rows.append(row)
+        rows = (
+            [col1, *row_values]
+            for col1, row_values in zip(request.columns, corr_values.tolist(), strict=True)
+        )
 
-        tsv = self._tsv_formatter.format_table(headers, rows)
+        tsv = self._tsv_formatter.format_table(headers, rows, float_format="%.4f")
 
         excel_output = ExcelOutput(tsv=tsv, formula=None, references=None)
 
         # Create response
         metadata = self._get_file_metadata(request.file_path, request.sheet_name)
-        metadata.rows_total = len(df)
-        metadata.columns_total = len(df.columns)
+        metadata.rows_total = n_rows
+        metadata.columns_total = n_cols
 
-        performance = self._get_performance_metrics(start_time, len(df_clean), False)
+        performance = self._get_performance_metrics(start_time, rows_clean, False)
 
-        return CorrelateResponse(
+        response = CorrelateResponse(
             correlation_matrix=correlation_dict,
             method=request.method,
             columns=request.columns,
@@ -213,6 +450,9 @@ class StatisticsOperations(BaseOperations):
             metadata=metadata,
             performance=performance,
         )
+        self._put_cached_stats(cache_key, response)
+
+        return response
 
     def detect_outliers(self, request: DetectOutliersRequest) -> DetectOutliersResponse:
         """Detect outliers in a column.
@@ -228,6 +468,12 @@ class StatisticsOperations(BaseOperations):
         """
         start_time = time.time()
 
+        # Identical request on an unchanged file - serve the previous result
+        cache_key = self._stats_cache_key(request)
+        cached = self._get_cached_stats(cache_key, start_time, DetectOutliersResponse)
+        if cached is not None:
+            return cached
+
         # Load data
         df, header_row = self._load_with_header_detection(
             request.file_path, request.sheet_name, request.header_row
@@ -235,69 +481,51 @@ class StatisticsOperations(BaseOperations):
 
         # Find column using normalized matching
         actual_column = self._find_column(df, request.column, context="detect_outliers")
+        n_rows, n_cols = df.shape
 
-        # Get column data
-        col_data = df[actual_column].copy()
+        # Get column data (read-only below, no copy needed)
+        col_data = df[actual_column]
 
         # Ensure column is numeric (with auto-conversion for text-stored numbers)
         col_data = self._ensure_numeric_column(col_data, request.column)
 
-        # Remove NaN values for calculation
-        non_null_data = col_data.dropna()
+        # Extract the column once as float64; NaN rows are never outliers
+        col_values = col_data.to_numpy(dtype=np.float64, na_value=np.nan)
+        values = col_values[~np.isnan(col_values)]
 
-        if len(non_null_data) < 4:
+        if len(values) < 4:
             raise ValueError(
                 f"Not enough data for outlier detection. "
-                f"Only {len(non_null_data)} non-null values (minimum 4 required)"
+                f"Only {len(values)} non-null values (minimum 4 required)"
             )
 
         # Detect outliers based on method
         if request.method == "iqr":
-            # IQR method
-            q1 = non_null_data.quantile(0.25)
-            q3 = non_null_data.quantile(0.75)
-            iqr = q3 - q1
-            lower_bound = q1 - request.threshold * iqr
-            upper_bound = q3 + request.threshold * iqr
-
-            outlier_mask = (col_data < lower_bound) | (col_data > upper_bound)
-
+            outlier_mask = _iqr_mask(col_values, values, request.threshold)
         elif request.method == "zscore":
-            # Z-score method
-            mean = non_null_data.mean()
-            std = non_null_data.std()
-
-            if std == 0:
-                raise ValueError("Standard deviation is 0, cannot use Z-score method")
-
-            z_scores = (col_data - mean) / std
-            outlier_mask = z_scores.abs() > request.threshold
-
+            outlier_mask = _zscore_mask(col_values, values, request.threshold)
         else:
             raise ValueError(f"Unknown outlier detection method: {request.method}")
 
-        # Get outlier rows
-        outlier_indices = df[outlier_mask].index.tolist()
-        outlier_rows = []
-
-        for idx in outlier_indices:
-            row_dict = df.loc[idx].to_dict()
-            # Format values
-            row_dict = {k: self._format_value(v) for k, v in row_dict.items()}
-            row_dict["_row_index"] = int(idx)
-            outlier_rows.append(row_dict)
+        # Get outlier rows in one positional gather, formatted column-wise
+        outlier_positions = np.flatnonzero(outlier_mask)
+        outlier_df = df.iloc[outlier_positions]
+        keys = [str(col) for col in df.columns]
+        columns = [self._format_column(outlier_df.iloc[:, i]) for i in range(len(keys))]
+        row_indices = df.index.to_numpy()[outlier_positions].astype(int).tolist()
+        outlier_rows = [
+            dict(zip(keys, row_values, strict=True), _row_index=row_index)
+            for *row_values, row_index in zip(*columns, row_indices, strict=True)
+        ]
 
         # Generate TSV output
         if outlier_rows:
-            # Include all columns plus row index
-            headers = ["_row_index"] + [str(col) for col in df.columns]
-            rows = []
-
-            for row in outlier_rows:
-                tsv_row = [row.get(col) for col in headers]
-                rows.append(tsv_row)
-
-            tsv = self._tsv_formatter.format_table(headers, rows)
+            # Include all columns plus row index - rows stream from the formatted
+            # columns, no per-cell dict lookups
+            headers = ["_row_index"] + keys
+            tsv = self._tsv_formatter.format_table(
+                headers, zip(row_indices, *columns, strict=True)
+            )
         else:
             tsv = "No outliers detected"
 
@@ -305,10 +533,10 @@ class StatisticsOperations(BaseOperations):
 
         # Create response
         metadata = self._get_file_metadata(request.file_path, request.sheet_name)
-        metadata.rows_total = len(df)
-        metadata.columns_total = len(df.columns)
+        metadata.rows_total = n_rows
+        metadata.columns_total = n_cols
 
-        performance = self._get_performance_metrics(start_time, len(df), False)
+        performance = self._get_performance_metrics(start_time, n_rows, False)
 
         response = DetectOutliersResponse(
             outliers=outlier_rows,
@@ -324,7 +552,8 @@ class StatisticsOperations(BaseOperations):
         self._validate_response_size(
             response,
             rows_count=len(outlier_rows),
-            columns_count=len(df.columns)
+            columns_count=n_cols
         )
+        self._put_cached_stats(cache_key, response)
 
         return response
@@ -6,12 +6,12 @@
 """Time series operations for Excel data."""
 
 import time
-from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from ..core.file_loader import FileLoader
-from ..excel.formula_generator import FormulaGenerator
+from ..excel.formula_generator import column_letter
 from ..excel.tsv_formatter import TSVFormatter
 from ..models.requests import (
     CalculateMovingAverageRequest,
@@ -27,6 +27,102 @@ from ..models.responses import (
 from ..operations.base import BaseOperations
 from ..operations.filtering import FilterEngine
 
+# Period frequency for each calculate_period_change period_type
+PERIOD_FREQUENCIES = {"month": "M", "quarter": "Q", "year": "Y"}
+
+
+def _calendar_ordinals(dates: np.ndarray, unit: str) -> np.ndarray:
+    """Month or year ordinals of datetime64 values, same as astype("datetime64[unit]").
+
+    Casting to months/years does calendar math per element, which dominates
+    period bucketing. Sheets usually span far fewer days than they have
+    rows, so each day in the range is cast once and rows gather from that
+    table (a cheap day floor plus an index lookup).
+
+    Args:
+        dates: datetime64 values without NaT
+        unit: "M" (months) or "Y" (years)
+
+    Returns:
+        int64 ordinals counted from 1970
+    """
+    days = dates.astype("datetime64[D]").view(np.int64)
+    if len(days) == 0:
+        return days
+
+    first, last = days.min(), days.max()
+    if last - first >= len(days):
+        # Date range wider than the data - casting the rows directly is cheaper
+        return dates.astype(f"datetime64[{unit}]").view(np.int64)
+
+    table = np.arange(first, last + 1).astype("datetime64[D]").astype(f"datetime64[{unit}]")
+    ordinals: np.ndarray = table.view(np.int64)[days - first]
+    return ordinals
+
+
+def _sum_by_period(dates: pd.Series, values: pd.Series, period_type: str) -> pd.DataFrame:
+    """Sum values per calendar period, same result as grouping by dt.to_period().
+
+    Rows are bucketed by integer period ordinals (_calendar_ordinals), so no
+    per-row PeriodArray is built; only the resulting (few) period labels are
+    turned into Period strings.
+
+    Args:
+        dates: Datetime column, naive or tz-aware (NaT rows are skipped)
+        values: Numeric values aligned with dates
+        period_type: "month", "quarter" or "year"
+
+    Returns:
+        DataFrame with 'period' (str, e.g. "2024-01", "2024Q1", "2024") and
+        'value' columns, sorted by period
+    """
+    # to_period() buckets tz-aware dates by local wall time - drop the zone the same way
+    if isinstance(dates.dtype, pd.DatetimeTZDtype):
+        dates = dates.dt.tz_localize(None)
+    valid = dates.notna().to_numpy()
+    date_values = dates.to_numpy()
+    if period_type == "year":
+        ordinals = _calendar_ordinals(date_values[valid], "Y")
+    else:
+        ordinals = _calendar_ordinals(date_values[valid], "M")
+        if period_type == "quarter":
+            ordinals = ordinals // 3
+
+    sums = values[valid].groupby(ordinals).sum()
+    periods = pd.PeriodIndex.from_ordinals(
+        sums.index.to_numpy(), freq=PERIOD_FREQUENCIES[period_type]
+    )
+    return pd.DataFrame({'period': periods.astype(str), 'value': sums.to_numpy()})
+
+
+def _moving_average_prefix_sum(values: np.ndarray, window_size: int) -> np.ndarray | None:
+    """Rolling mean of an integer column from int64 prefix sums.
+
+    Window sums are exact, so the result equals pandas rolling(min_periods=1)
+    without walking the window.
+
+    Args:
+        values: Integer values in output (sorted) order
+        window_size: Number of rows in the window
+
+    Returns:
+        Moving averages, or None if the prefix sums could overflow int64
+    """
+    n = len(values)
+    if n == 0 or max(int(values.max()), -int(values.min())) * n >= 2**63:
+        return None
+
+    prefix = np.empty(n + 1, dtype=np.int64)
+    prefix[0] = 0
+    np.cumsum(values, out=prefix[1:])
+
+    window_sums = prefix[1:].copy()
+    if window_size < n:
+        window_sums[window_size:] -= prefix[1:n + 1 - window_size]
+    counts = np.minimum(np.arange(1, n + 1), window_size)
+    averages: np.ndarray = window_sums / counts
+    return averages
+
 
 class TimeSeriesOperations(BaseOperations):
     """Operations for time series analysis."""
@@ -50,13 +146,24 @@ class TimeSeriesOperations(BaseOperations):
         Returns:
             Excel column letter (A, B, ..., Z, AA, AB, ...)
         """
-        result = ""
-        col_index += 1  # Excel is 1-based
-        while col_index > 0:
-            col_index -= 1
-            result = chr(65 + (col_index % 26)) + result
-            col_index //= 26
-        return result
+        return column_letter(col_index)
+
+    def _sort_positions(self, order_col: pd.Series) -> np.ndarray:
+        """Get row positions that sort a frame by one column.
+
+        Same order as df.sort_values(by=column, kind='stable'), but only that
+        column is sorted.
+
+        Args:
+            order_col: Column to sort by
+
+        Returns:
+            Integer positions for DataFrame.take
+        """
+        positions: np.ndarray = (
+            order_col.reset_index(drop=True).sort_values(kind='stable').index.to_numpy()
+        )
+        return positions
 
     def calculate_period_change(
         self, request: CalculatePeriodChangeRequest
@@ -80,61 +187,57 @@ class TimeSeriesOperations(BaseOperations):
         actual_date_column = self._find_column(df, request.date_column, context="calculate_period_change")
         actual_value_column = self._find_column(df, request.value_column, context="calculate_period_change")
 
-        # Apply filters
+        # Apply filters to the two needed columns only (no filtered full-frame copy),
+        # so the conversions below touch only surviving rows
+        date_col = df[actual_date_column]
+        value_col = df[actual_value_column]
         if request.filters:
-            df = self._filter_engine.apply_filters(df, request.filters, request.logic)
+            mask = self._filter_engine.build_mask(df, request.filters, request.logic)
+            date_col = date_col[mask]
+            value_col = value_col[mask]
 
         # Ensure date column is datetime
-        if not pd.api.types.is_datetime64_any_dtype(df[actual_date_column]):
-            df[actual_date_column] = pd.to_datetime(df[actual_date_column], errors='coerce')
-
-        # Convert value column to numeric
-        value_col = pd.to_numeric(df[actual_value_column], errors='coerce')
-
-        # Group by period
-        if request.period_type == "month":
-            df['period'] = df[actual_date_column].dt.to_period('M')
-        elif request.period_type == "quarter":
-            df['period'] = df[actual_date_column].dt.to_period('Q')
-        elif request.period_type == "year":
-            df['period'] = df[actual_date_column].dt.to_period('Y')
-
-        # Aggregate by period
-        period_data = df.groupby('period')[actual_value_column].agg(
-            lambda x: pd.to_numeric(x, errors='coerce').sum()
-        ).reset_index()
-        period_data.columns = ['period', 'value']
-
-        # Calculate changes
-        period_data['change_absolute'] = period_data['value'].diff()
-        period_data['change_percent'] = (
-            period_data['value'].pct_change() * 100
-        )
+        if not pd.api.types.is_datetime64_any_dtype(date_col):
+            date_col = pd.to_datetime(date_col, errors='coerce')
+
+        # Convert value column to numeric (skip columns that already are)
+        if not pd.api.types.is_numeric_dtype(value_col):
+            value_col = pd.to_numeric(value_col, errors='coerce')
+
+        # Bucket rows by period ordinal (no per-row Period column) and sum
+        period_data = _sum_by_period(date_col, value_col, request.period_type)
+
+        # Calculate changes in one NumPy pass (same values as diff() / pct_change() * 100)
+        values = period_data['value'].to_numpy(dtype=np.float64)
+        change_absolute = np.full_like(values, np.nan)
+        change_percent = np.full_like(values, np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.subtract(values[1:], values[:-1], out=change_absolute[1:])
+            change_percent[1:] = (values[1:] / values[:-1] - 1) * 100
+        period_data['change_absolute'] = change_absolute
+        period_data['change_percent'] = change_percent
 
         # Format results
-        periods = []
-        for _, row in period_data.iterrows():
-            periods.append({
-                'period': str(row['period']),
-                'value': self._format_value(row['value']),
-                'change_absolute': self._format_value(row['change_absolute']),
-                'change_percent': self._format_value(row['change_percent']),
-            })
+        result_columns = ['period', 'value', 'change_absolute', 'change_percent']
+        columns = [period_data['period'].tolist()] + [
+            self._format_column(period_data[col]) for col in result_columns[1:]
+        ]
+        periods = [
+            dict(zip(result_columns, values, strict=True))
+            for values in zip(*columns, strict=True)
+        ]
 
         # Generate TSV
         headers = ['Period', 'Value', 'Change (Absolute)', 'Change (%)']
-        rows = [
-            [p['period'], p['value'], p['change_absolute'], p['change_percent']]
-            for p in periods
-        ]
-        tsv = self._tsv_formatter.format_table(headers, rows)
+        tsv = self._tsv_formatter.format_columns(headers, columns)
 
         # Generate Excel formula for percent change
         formula = "=(B2-B1)/B1*100"
 
         metadata = self._get_file_metadata(request.file_path, request.sheet_name)
-        metadata.rows_total = len(df)
-        metadata.columns_total = len(df.columns)
+        metadata.rows_total = len(date_col)
+        # Source columns plus the derived period column
+        metadata.columns_total = len(df.columns) + ('period' not in df.columns)
 
         return CalculatePeriodChangeResponse(
             periods=periods,
@@ -142,7 +245,7 @@ class TimeSeriesOperations(BaseOperations):
             value_column=request.value_column,
             excel_output=ExcelOutput(tsv=tsv, formula=formula),
             metadata=metadata,
-            performance=self._get_performance_metrics(start_time, len(df), False),
+            performance=self._get_performance_metrics(start_time, len(date_col), False),
         )
 
     def calculate_running_total(
@@ -167,45 +270,57 @@ class TimeSeriesOperations(BaseOperations):
         actual_order_column = self._find_column(df, request.order_column, context="calculate_running_total")
         actual_value_column = self._find_column(df, request.value_column, context="calculate_running_total")
 
-        # Apply filters
-        if request.filters:
-            df = self._filter_engine.apply_filters(df, request.filters, request.logic)
-
         # Normalize group_by_columns if provided
         actual_group_by_columns = None
         if request.group_by_columns:
             actual_group_by_columns = self._find_columns(df, request.group_by_columns, context="calculate_running_total")
 
-        # Convert value column to numeric
-        df[actual_value_column] = pd.to_numeric(df[actual_value_column], errors='coerce')
+        result_columns = [actual_order_column, actual_value_column, 'running_total']
+        if actual_group_by_columns:
+            result_columns = actual_group_by_columns + result_columns
+        source_columns = list(dict.fromkeys(result_columns[:-1]))
+
+        # Apply filters to the result columns only (no filtered full-frame copy)
+        if request.filters:
+            mask = self._filter_engine.build_mask(df, request.filters, request.logic)
+            source_df = df.loc[mask, source_columns]
+        else:
+            source_df = df[source_columns]
 
-        # Sort by order column
-        df = df.sort_values(by=actual_order_column)
+        # Sort only the result columns by the order column (not the whole frame)
+        positions = self._sort_positions(source_df[actual_order_column])
+        sorted_df = source_df.take(positions)
+
+        # Convert value column to numeric (skip columns that already are)
+        if not pd.api.types.is_numeric_dtype(sorted_df[actual_value_column]):
+            sorted_df[actual_value_column] = pd.to_numeric(
+                sorted_df[actual_value_column], errors='coerce'
+            )
 
         # Calculate running total
         if actual_group_by_columns:
-            # Running total within groups
-            df['running_total'] = df.groupby(actual_group_by_columns)[actual_value_column].cumsum()
+            # Running total within groups (group key order is irrelevant for
+            # cumsum, so skip sorting the keys)
+            grouped = sorted_df.groupby(actual_group_by_columns, sort=False)
+            sorted_df['running_total'] = grouped[actual_value_column].cumsum()
         else:
             # Overall running total
-            df['running_total'] = df[actual_value_column].cumsum()
+            sorted_df['running_total'] = sorted_df[actual_value_column].cumsum()
 
         # Format results
-        result_columns = [actual_order_column, actual_value_column, 'running_total']
-        if actual_group_by_columns:
-            result_columns = actual_group_by_columns + result_columns
-
-        rows = []
-        for _, row in df.iterrows():
-            row_dict = {}
-            for col in result_columns:
-                row_dict[col] = self._format_value(row[col])
-            rows.append(row_dict)
+        # Format column-wise; the TSV is joined straight from the columns
+        columns = [self._format_column(sorted_df[col]) for col in result_columns]
 
         # Generate TSV
         headers = result_columns
-        tsv_rows = [[row[col] for col in result_columns] for row in rows]
-        tsv = self._tsv_formatter.format_table(headers, tsv_rows)
+        tsv = self._tsv_formatter.format_columns(headers, columns)
+
+        # CONTEXT OVERFLOW PROTECTION: reject oversized results before building row dicts
+        self._validate_tsv_size(tsv, rows_count=len(sorted_df), columns_count=len(result_columns))
+        rows = [
+            dict(zip(result_columns, values, strict=True))
+            for values in zip(*columns, strict=True)
+        ]
 
         # Generate Excel formula
         # Find value_column index in result_columns
@@ -214,8 +329,9 @@ class TimeSeriesOperations(BaseOperations):
         formula = f"=SUM(${value_col_letter}$2:{value_col_letter}2)"
 
         metadata = self._get_file_metadata(request.file_path, request.sheet_name)
-        metadata.rows_total = len(df)
-        metadata.columns_total = len(df.columns)
+        metadata.rows_total = len(sorted_df)
+        # Source columns plus the added running_total column
+        metadata.columns_total = len(df.columns) + ('running_total' not in df.columns)
 
         response = CalculateRunningTotalResponse(
             rows=rows,
@@ -224,7 +340,7 @@ class TimeSeriesOperations(BaseOperations):
             group_by_columns=request.group_by_columns,
             excel_output=ExcelOutput(tsv=tsv, formula=formula),
             metadata=metadata,
-            performance=self._get_performance_metrics(start_time, len(df), False),
+            performance=self._get_performance_metrics(start_time, len(sorted_df), False),
         )
 
         # CONTEXT OVERFLOW PROTECTION: Validate response size
@@ -258,34 +374,62 @@ class TimeSeriesOperations(BaseOperations):
         actual_order_column = self._find_column(df, request.order_column, context="calculate_moving_average")
         actual_value_column = self._find_column(df, request.value_column, context="calculate_moving_average")
 
-        # Apply filters
+        result_columns = [actual_order_column, actual_value_column, 'moving_average']
+        source_columns = list(dict.fromkeys(result_columns[:-1]))
+
+        # Apply filters to the result columns only (no filtered full-frame copy)
         if request.filters:
-            df = self._filter_engine.apply_filters(df, request.filters, request.logic)
+            mask = self._filter_engine.build_mask(df, request.filters, request.logic)
+            source_df = df.loc[mask, source_columns]
+        else:
+            source_df = df[source_columns]
 
-        # Convert value column to numeric
-        df[actual_value_column] = pd.to_numeric(df[actual_value_column], errors='coerce')
+        # Sort only the result columns by the order column (not the whole frame)
+        sorted_df = source_df.take(self._sort_positions(source_df[actual_order_column]))
 
-        # Sort by order column
-        df = df.sort_values(by=actual_order_column)
+        # Convert value column to numeric (skip columns that already are)
+        if not pd.api.types.is_numeric_dtype(sorted_df[actual_value_column]):
+            sorted_df[actual_value_column] = pd.to_numeric(
+                sorted_df[actual_value_column], errors='coerce'
+            )
 
         # Calculate moving average
-        df['moving_average'] = df[actual_value_column].rolling(
-            window=request.window_size, min_periods=1
-        ).mean()
+        moving_average = None
+        value_kind = sorted_df[actual_value_column].dtype.kind
+        if value_kind == "i":
+            moving_average = _moving_average_prefix_sum(
+                sorted_df[actual_value_column].to_numpy(), request.window_size
+            )
+        elif value_kind == "f":
+            # Whole-number floats without gaps (e.g. a blank-cell column after
+            # filtering) take the exact integer path too; NaN/inf fail the check
+            floats = sorted_df[actual_value_column].to_numpy()
+            with np.errstate(invalid="ignore"):
+                ints = floats.astype(np.int64)
+            if np.array_equal(ints, floats):
+                moving_average = _moving_average_prefix_sum(ints, request.window_size)
+
+        if moving_average is not None:
+            sorted_df['moving_average'] = moving_average
+        else:
+            sorted_df['moving_average'] = sorted_df[actual_value_column].rolling(
+                window=request.window_size, min_periods=1
+            ).mean()
 
         # Format results
-        result_columns = [actual_order_column, actual_value_column, 'moving_average']
-        rows = []
-        for _, row in df.iterrows():
-            row_dict = {}
-            for col in result_columns:
-                row_dict[col] = self._format_value(row[col])
-            rows.append(row_dict)
+        # Format column-wise; the TSV is joined straight from the columns
+        columns = [self._format_column(sorted_df[col]) for col in result_columns]
 
         # Generate TSV
         headers = result_columns
-        tsv_rows = [[row[col] for col in result_columns] for row in rows]
-        tsv = self._tsv_formatter.format_table(headers, tsv_rows)
+        tsv = self._tsv_formatter.format_columns(headers, columns)
+
+        # CONTEXT OVERFLOW PROTECTION: reject oversized results before building row dicts
+        self._validate_tsv_size(tsv, rows_count=len(sorted_df), columns_count=len(result_columns))
+        rows = [
+            dict(zip(result_columns, values, strict=True))
+            for values in zip(*columns, strict=True)
+        ]
 
         # Generate Excel formula
         # Find value_column index in result_columns
@@ -295,8 +439,9 @@ class TimeSeriesOperations(BaseOperations):
         formula = f"=AVERAGE({value_col_letter}{start_row}:{value_col_letter}2)"
 
         metadata = self._get_file_metadata(request.file_path, request.sheet_name)
-        metadata.rows_total = len(df)
-        metadata.columns_total = len(df.columns)
+        metadata.rows_total = len(sorted_df)
+        # Source columns plus the added moving_average column
+        metadata.columns_total = len(df.columns) + ('moving_average' not in df.columns)
 
         response = CalculateMovingAverageResponse(
             rows=rows,
@@ -305,7 +450,7 @@ class TimeSeriesOperations(BaseOperations):
             window_size=request.window_size,
             excel_output=ExcelOutput(tsv=tsv, formula=formula),
             metadata=metadata,
-            performance=self._get_performance_metrics(start_time, len(df), False),
+            performance=self._get_performance_metrics(start_time, len(sorted_df), False),
         )
 
         # CONTEXT OVERFLOW PROTECTION: Validate response size
@@ -7,6 +7,8 @@
 
 import time
 
+import numpy as np
+
 from ..core.file_loader import FileLoader
 from ..excel.tsv_formatter import TSVFormatter
 from ..models.requests import (
@@ -61,29 +63,28 @@ class ValidationOperations(BaseOperations):
         duplicate_mask = df.duplicated(subset=actual_columns, keep=False)
         duplicate_df = df[duplicate_mask]
 
-        # Convert to list of dicts
-        duplicates = []
-        for idx in range(len(duplicate_df)):
-            row_dict = duplicate_df.iloc[idx].to_dict()
-            # Format values and add row index
-            formatted_dict = {str(k): self._format_value(v) for k, v in row_dict.items()}
-            formatted_dict["_row_index"] = int(duplicate_df.index[idx])
-            duplicates.append(formatted_dict)
+        # Format column-wise; the TSV is joined straight from the columns
+        keys = [str(col) for col in duplicate_df.columns]
+        columns = [self._format_column(duplicate_df.iloc[:, i]) for i in range(len(keys))]
+        row_indices = [int(idx) for idx in duplicate_df.index]
 
         # Generate TSV output
-        if duplicates:
+        if row_indices:
             # Include all columns plus row index
-            headers = ["_row_index"] + [str(col) for col in df.columns]
-            rows = []
-
-            for dup in duplicates:
-                tsv_row = [dup.get(col) for col in headers]
-                rows.append(tsv_row)
+            headers = ["_row_index"] + keys
+            tsv = self._tsv_formatter.format_columns(headers, [row_indices, *columns])
 
-            tsv = self._tsv_formatter.format_table(headers, rows)
+            # CONTEXT OVERFLOW PROTECTION: reject oversized results before building row dicts
+            self._validate_tsv_size(tsv, rows_count=len(row_indices), columns_count=len(df.columns))
         else:
             tsv = "No duplicates found"
 
+        duplicates = []
+        for row_index, *values in zip(row_indices, *columns, strict=True):
+            formatted_dict = dict(zip(keys, values, strict=True))
+            formatted_dict["_row_index"] = row_index
+            duplicates.append(formatted_dict)
+
         excel_output = ExcelOutput(tsv=tsv, formula=None, references=None)
 
         # Create response
@@ -133,17 +134,18 @@ class ValidationOperations(BaseOperations):
         # Find all columns using normalized matching
         actual_columns = self._find_columns(df, request.columns, context="find_nulls")
 
-        # Analyze nulls for each column
+        # Analyze nulls for each column on plain boolean arrays
+        row_index = df.index.to_numpy()
         null_info = {}
         total_nulls = 0
 
         for col in actual_columns:
-            null_mask = df[col].isna()
-            null_count = int(null_mask.sum())
+            null_mask = df[col].isna().to_numpy()
+            null_count = int(np.count_nonzero(null_mask))
             total_nulls += null_count
 
-            # Get indices of null rows
-            null_indices = df[null_mask].index.tolist()
+            # Get indices of the first 100 null rows (no boolean indexing of the frame)
+            null_positions = np.flatnonzero(null_mask)[:100]
 
             # Calculate percentage
             null_percentage = (null_count / len(df) * 100) if len(df) > 0 else 0
@@ -152,8 +154,8 @@ class ValidationOperations(BaseOperations):
                 "null_count": null_count,
                 "null_percentage": round(null_percentage, 2),
                 "total_rows": len(df),
-                "null_indices": [int(idx) for idx in null_indices[:100]],  # Limit to first 100
-                "truncated": len(null_indices) > 100,
+                "null_indices": [int(idx) for idx in row_index[null_positions]],
+                "truncated": null_count > 100,
             }
 
         # Generate TSV output
@@ -313,6 +313,30 @@ def temp_excel_path(tmp_path) -> Generator[Path, None, None]:
     yield tmp_path
 
 
+@pytest.fixture
+def write_column_workbook():
+    """Provides helper that (re)writes a workbook with one column on sheet "Data".
+    
+    Usage:
+        def test_rewrite(temp_excel_path, write_column_workbook):
+            path = temp_excel_path / "data.xlsx"
+            write_column_workbook(path, "Amount", [1, 2, 3])
+    """
+    import openpyxl
+    
+    def _write(path: Path, header: str, values: list) -> None:
+        """Save header plus one row per value, replacing any existing file."""
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "Data"
+        ws.append([header])
+        for value in values:
+            ws.append([value])
+        wb.save(path)
+    
+    return _write
+
+
 @pytest.fixture
 def assert_dataframe_equals():
     """Provides helper function for comparing DataFrames in tests.
@@ -360,6 +384,31 @@ def assert_excel_formula():
     return _assert_formula
 
 
+@pytest.fixture
+def count_calls(monkeypatch):
+    """Provides helper that counts calls to an attribute (restored after the test).
+
+    Usage:
+        def test_cache(count_calls):
+            calls = count_calls(loader, "_read_sheet")
+            loader.load(path, sheet)
+            assert len(calls) == 1
+    """
+    def _count_calls(target, name: str) -> list[tuple]:
+        """Wrap target.name so each call is recorded and still runs."""
+        calls = []
+        original = getattr(target, name)
+
+        def counting(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(target, name, counting)
+        return calls
+
+    return _count_calls
+
+
 # ============================================================================
 # PYTEST CONFIGURATION
 # ============================================================================
@@ -1107,3 +1107,87 @@ def test_rank_rows_nested_with_negation(numeric_types_fixture, file_loader):
     print(f"✅ Ranked {response.total_rows} rows with negated group")
     
     assert response.total_rows > 0, "Should rank rows not matching the group"
+
+
+def test_rank_rows_whole_numbers_formatted_as_int(numeric_types_fixture, file_loader):
+    """Test rank_rows formats whole-number floats as ints next to float columns.
+    
+    Verifies:
+    - Rank values are ints, not 1.0-style floats
+    - Integer columns stay ints in rows and TSV
+    - Fractional columns keep their decimals
+    """
+    print(f"\n🔢 Testing rank_rows value formatting on: {numeric_types_fixture.name}")
+    
+    ops = AdvancedOperations(file_loader)
+    request = RankRowsRequest(
+        file_path=numeric_types_fixture.path_str,
+        sheet_name=numeric_types_fixture.sheet_name,
+        rank_column="Количество",
+        direction="desc",
+        top_n=3,
+    )
+    
+    # Act
+    response = ops.rank_rows(request)
+    
+    # Assert
+    first = response.rows[0]
+    print(f"✅ First row: {first}")
+    
+    assert first["rank"] == 1 and isinstance(first["rank"], int), "Rank should be int"
+    assert isinstance(first["Количество"], int), "Integer column should stay int"
+    assert isinstance(first["Цена"], float), "Fractional column should stay float"
+    
+    tsv_first_row = response.excel_output.tsv.split("\n")[1].split("\t")
+    assert tsv_first_row[0] == "1", "TSV rank should not have .0 suffix"
+
+
+def test_rank_rows_and_expression_keep_loaded_frame(file_loader, temp_excel_path):
+    """Test rank_rows and calculate_expression do not modify the cached DataFrame.
+    
+    Verifies:
+    - Text-stored numbers are ranked and calculated as numbers
+    - No rank or output column leaks into later operations on the same file
+    - The cached sheet still matches a fresh load
+    """
+    print(f"\n🏆 Testing advanced operations leave cached data intact")
+    
+    import openpyxl
+    from mcp_excel.core.file_loader import FileLoader
+    
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Item", "Score"])
+    for item, score in (("a", "30000000"), ("b", "n/a"), ("c", "pending"), ("d", "10000000")):
+        ws.append([item, score])
+    
+    test_file = temp_excel_path / "advanced_cache.xlsx"
+    wb.save(test_file)
+    
+    ops = AdvancedOperations(file_loader)
+    
+    # Act
+    rank_response = ops.rank_rows(RankRowsRequest(
+        file_path=str(test_file),
+        sheet_name="Data",
+        rank_column="Score",
+        direction="desc",
+    ))
+    expr_response = ops.calculate_expression(CalculateExpressionRequest(
+        file_path=str(test_file),
+        sheet_name="Data",
+        expression="Score * 2",
+        output_column_name="Doubled",
+    ))
+    cached_df = file_loader.load(str(test_file), "Data", header_row=0)
+    fresh_df = FileLoader().load(str(test_file), "Data", header_row=0)
+    
+    # Assert
+    print(f"✅ Ranked: {[(row['Item'], row['rank']) for row in rank_response.rows]}")
+    
+    assert [row["Item"] for row in rank_response.rows[:2]] == ["a", "d"], "Text numbers should be ranked"
+    assert "rank" not in expr_response.rows[0], "Rank column should not leak into later operations"
+    assert expr_response.rows[0]["Doubled"] == 60_000_000, "Text numbers should be calculated"
+    assert cached_df.equals(fresh_df), "Cached frame should match a fresh load"
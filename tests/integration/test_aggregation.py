@@ -1654,3 +1654,48 @@ def test_aggregate_sample_rows_without_filters(simple_fixture, file_loader):
     assert response.sample_rows is not None, "Should return sample_rows"
     assert len(response.sample_rows) <= 5, "Should return at most 5 rows"
     assert len(response.sample_rows) <= response.value, "Sample size should not exceed count"
+
+
+def test_group_by_keeps_loaded_frame(file_loader, temp_excel_path):
+    """Test group_by converts text values without modifying the cached DataFrame.
+    
+    Verifies:
+    - Text-stored numbers in a mostly-text column are summed
+    - Non-numeric text is ignored in the sum
+    - The cached sheet still matches a fresh load
+    """
+    print(f"\n📊 Testing group_by leaves cached data intact")
+    
+    import openpyxl
+    from mcp_excel.core.file_loader import FileLoader
+    
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Region", "Amount"])
+    for region, amount in (("North", "10000000"), ("South", "n/a"), ("North", "pending"), ("South", "-")):
+        ws.append([region, amount])
+    
+    test_file = temp_excel_path / "group_by_cache.xlsx"
+    wb.save(test_file)
+    
+    ops = DataOperations(file_loader)
+    request = GroupByRequest(
+        file_path=str(test_file),
+        sheet_name="Data",
+        group_columns=["Region"],
+        agg_column="Amount",
+        agg_operation="sum"
+    )
+    
+    # Act
+    response = ops.group_by(request)
+    cached_df = file_loader.load(str(test_file), "Data", header_row=0)
+    fresh_df = FileLoader().load(str(test_file), "Data", header_row=0)
+    
+    # Assert
+    print(f"✅ Groups: {response.groups}")
+    
+    sums = {group["Region"]: group["Amount_sum"] for group in response.groups}
+    assert sums == {"North": 10_000_000, "South": 0}, "Text numbers should be summed per group"
+    assert cached_df.equals(fresh_df), "Cached frame should match a fresh load"
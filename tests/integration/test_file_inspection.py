@@ -486,6 +486,39 @@ def test_get_sheet_info_manual_header_row(simple_fixture, file_loader):
     assert response.data_start_row == 1, "Data should start after header row 0"
 
 
+def test_get_sheet_info_manual_header_row_skips_raw_load(simple_fixture, count_calls):
+    """Test get_sheet_info does not run header detection when header_row is given.
+    
+    Verifies:
+    - The sheet is parsed once, without the raw (header=None) view
+    - Header detection is not run
+    - A repeated request parses nothing
+    """
+    print(f"\n📂 Testing get_sheet_info manual header_row skips raw load")
+    
+    from mcp_excel.core.file_loader import FileLoader
+    
+    loader = FileLoader()
+    ops = InspectionOperations(loader)
+    sheet_parses = count_calls(loader, "_read_sheet")
+    raw_loads = count_calls(loader, "_load_raw")
+    detections = count_calls(ops._header_detector, "detect")
+    request = GetSheetInfoRequest(
+        file_path=simple_fixture.path_str,
+        sheet_name=simple_fixture.sheet_name,
+        header_row=0
+    )
+    
+    ops.get_sheet_info(request)
+    ops.get_sheet_info(request)
+    
+    print(f"✅ Sheet parses: {len(sheet_parses)}, detections: {len(detections)}")
+    
+    assert len(sheet_parses) == 1, f"Expected one sheet parse, got {len(sheet_parses)}"
+    assert len(raw_loads) == 0, "Raw view should not be loaded"
+    assert len(detections) == 0, "Header detection should not run"
+
+
 def test_get_sheet_info_multilevel_headers(multilevel_headers_fixture, file_loader):
     """Test get_sheet_info with multi-level headers.
     
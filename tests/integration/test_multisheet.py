@@ -122,6 +122,76 @@ def test_find_column_case_insensitive(multi_sheet_fixture, file_loader):
     assert response.found_in[0]["column_name"] == "Товар", "Should return original column name"
 
 
+def test_find_column_repeated_calls_reuse_index(multi_sheet_fixture, file_loader, count_calls):
+    """Test find_column gives identical results when repeated.
+    
+    Verifies:
+    - Second call with different case returns the same matches
+    - Second call does not parse any sheet again
+    """
+    print(f"\n📂 Testing find_column repeated calls")
+    
+    ops = InspectionOperations(file_loader)
+    first = ops.find_column(FindColumnRequest(
+        file_path=multi_sheet_fixture.path_str,
+        column_name="КЛИЕНТ",
+        search_all_sheets=True
+    ))
+    sheet_parses = count_calls(file_loader, "_read_sheet")
+    second = ops.find_column(FindColumnRequest(
+        file_path=multi_sheet_fixture.path_str,
+        column_name="клиент",
+        search_all_sheets=True
+    ))
+    
+    print(f"✅ Matches: {first.total_matches}, sheet parses on repeat: {len(sheet_parses)}")
+    
+    assert first.total_matches >= 1, "Should find column"
+    assert first.found_in == second.found_in, "Repeated calls should return same matches"
+    assert len(sheet_parses) == 0, "Repeated call should not parse sheets again"
+
+
+def test_find_column_sees_renamed_column_after_file_change(temp_excel_path, file_loader):
+    """Test find_column picks up column changes when the file is rewritten.
+    
+    Verifies:
+    - A column found before the rewrite is no longer reported afterwards
+    - The renamed column is found after the rewrite (no stale column index)
+    """
+    print(f"\n📂 Testing find_column after file change")
+    
+    import os
+    import openpyxl
+    
+    test_file = temp_excel_path / "renamed.xlsx"
+    
+    def write_header(name):
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "Data"
+        ws.append(["Товар", name])
+        ws.append(["Яблоки", "Ромашка"])
+        wb.save(test_file)
+    
+    ops = InspectionOperations(file_loader)
+    
+    write_header("Клиент")
+    before = ops.find_column(FindColumnRequest(file_path=str(test_file), column_name="клиент"))
+    
+    write_header("Покупатель")
+    # Bump mtime explicitly in case the filesystem timestamp resolution is coarse
+    stat = test_file.stat()
+    os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    old_name = ops.find_column(FindColumnRequest(file_path=str(test_file), column_name="клиент"))
+    new_name = ops.find_column(FindColumnRequest(file_path=str(test_file), column_name="ПОКУПАТЕЛЬ"))
+    
+    print(f"✅ Before: {before.total_matches}, old name after: {old_name.total_matches}, new name: {new_name.total_matches}")
+    
+    assert before.total_matches == 1, "Should find original column"
+    assert old_name.total_matches == 0, "Old column name should be gone after rewrite"
+    assert new_name.found_in[0]["column_name"] == "Покупатель", "Should find renamed column"
+
+
 def test_find_column_not_found(multi_sheet_fixture, file_loader):
     """Test find_column when column doesn't exist.
     
@@ -377,6 +377,57 @@ def test_get_column_stats_all_nulls(file_loader, temp_excel_path):
     assert "no non-null" in str(exc_info.value).lower()
 
 
+def test_get_column_stats_matches_pandas(file_loader, temp_excel_path):
+    """Test get_column_stats values against pandas reductions.
+    
+    Verifies:
+    - Mean, median, std and quartiles match pandas on a column with nulls
+    - Null count and min/max are correct
+    """
+    print(f"\n📊 Testing get_column_stats against pandas")
+    
+    import openpyxl
+    import pandas as pd
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    
+    # Large integers so the column is not mistaken for Excel date serials
+    values = [7, None, 3, 15, None, 8, 1, 42, 5, 9, 12]
+    values = [v * 10_000_000 if v is not None else None for v in values]
+    ws.append(["Value"])
+    for value in values:
+        ws.append([value])
+    
+    test_file = temp_excel_path / "stats_vs_pandas.xlsx"
+    wb.save(test_file)
+    
+    ops = StatisticsOperations(file_loader)
+    request = GetColumnStatsRequest(
+        file_path=str(test_file),
+        sheet_name="Data",
+        column="Value",
+        header_row=0,
+        filters=[]
+    )
+    
+    # Act
+    response = ops.get_column_stats(request)
+    expected = pd.Series(values, dtype="float64").dropna()
+    
+    # Assert
+    print(f"✅ Stats: {response.stats}")
+    
+    assert response.stats.count == 9
+    assert response.stats.null_count == 2
+    assert response.stats.mean == pytest.approx(expected.mean())
+    assert response.stats.median == pytest.approx(expected.median())
+    assert response.stats.std == pytest.approx(expected.std())
+    assert response.stats.q25 == pytest.approx(expected.quantile(0.25))
+    assert response.stats.q75 == pytest.approx(expected.quantile(0.75))
+    assert response.stats.min == 10_000_000 and response.stats.max == 420_000_000
+
+
 def test_get_column_stats_performance(numeric_types_fixture, file_loader):
     """Test that get_column_stats includes performance metrics.
     
@@ -620,6 +671,89 @@ def test_correlate_text_stored_numbers(file_loader, temp_excel_path):
     assert abs(response.correlation_matrix["X"]["Y"] - 1.0) < 0.01, "Should have perfect correlation"
 
 
+def test_correlate_normalized_column_names(file_loader, temp_excel_path):
+    """Test correlate when requested names differ from headers by whitespace.
+    
+    Verifies:
+    - Columns found via normalized matching are correlated
+    - Result matrix is keyed by the requested names
+    """
+    print(f"\n🔗 Testing correlate with normalized column names")
+    
+    import openpyxl
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    
+    ws.append(["Price\u00A0USD", "Qty"])
+    for i in range(1, 11):
+        ws.append([i * 100000.5, 20 - i])  # Perfect negative correlation
+    
+    test_file = temp_excel_path / "normalized_corr.xlsx"
+    wb.save(test_file)
+    
+    ops = StatisticsOperations(file_loader)
+    request = CorrelateRequest(
+        file_path=str(test_file),
+        sheet_name="Data",
+        columns=["Price USD", " Qty "],
+        method="pearson",
+        filters=[]
+    )
+    
+    # Act
+    response = ops.correlate(request)
+    
+    # Assert
+    print(f"✅ Correlation: {response.correlation_matrix}")
+    
+    assert response.correlation_matrix["Price USD"][" Qty "] == -1.0, "Should have perfect negative correlation"
+    assert response.correlation_matrix["Price USD"]["Price USD"] == 1.0, "Diagonal should be 1"
+
+
+def test_correlate_many_text_columns(file_loader, temp_excel_path):
+    """Test correlate with many text-stored numeric columns.
+    
+    Verifies:
+    - Wide selections of text columns are all converted and correlated
+    - Matrix matches the expected perfect correlations
+    """
+    print(f"\n🔗 Testing correlate with many text-stored numeric columns")
+    
+    import openpyxl
+    
+    column_names = [f"C{i}" for i in range(8)]
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    
+    ws.append(column_names)
+    for row in range(1, 11):
+        # Even columns rise, odd columns fall
+        ws.append([str(row * 100000.5) if i % 2 == 0 else str(-row * 200000.25) for i in range(len(column_names))])
+    
+    test_file = temp_excel_path / "many_text_corr.xlsx"
+    wb.save(test_file)
+    
+    ops = StatisticsOperations(file_loader)
+    request = CorrelateRequest(
+        file_path=str(test_file),
+        sheet_name="Data",
+        columns=column_names,
+        method="pearson",
+        filters=[]
+    )
+    
+    # Act
+    response = ops.correlate(request)
+    
+    # Assert
+    print(f"✅ C0 row: {response.correlation_matrix['C0']}")
+    
+    assert response.correlation_matrix["C0"]["C2"] == 1.0, "Rising columns should correlate"
+    assert response.correlation_matrix["C0"]["C1"] == -1.0, "Rising vs falling should anti-correlate"
+
+
 def test_correlate_single_column_error(numeric_types_fixture, file_loader):
     """Test correlate with single column (error case).
     
@@ -1474,3 +1608,139 @@ def test_get_column_stats_sample_rows_none(simple_fixture, file_loader):
     print(f"✅ Stats count: {response.stats.count}, Sample rows: {response.sample_rows}")
     
     assert response.sample_rows is None, "Should return None when sample_rows=None"
+
+
+async def test_statistics_async_wrappers(numeric_types_fixture, file_loader):
+    """Test async wrappers that run statistics in worker threads.
+    
+    Verifies:
+    - get_column_stats_async/detect_outliers_async return the same results as sync calls
+    - Concurrent awaits (including repeated requests hitting the result cache) complete without errors
+    """
+    print(f"\n📊 Testing async statistics wrappers")
+    
+    import asyncio
+    
+    ops = StatisticsOperations(file_loader)
+    stats_request = GetColumnStatsRequest(
+        file_path=numeric_types_fixture.path_str,
+        sheet_name=numeric_types_fixture.sheet_name,
+        column="Количество",
+        filters=[]
+    )
+    outliers_request = DetectOutliersRequest(
+        file_path=numeric_types_fixture.path_str,
+        sheet_name=numeric_types_fixture.sheet_name,
+        column="Количество",
+        method="iqr",
+        threshold=1.5
+    )
+    
+    # Act
+    stats_response, outliers_response, *repeated = await asyncio.gather(
+        ops.get_column_stats_async(stats_request),
+        ops.detect_outliers_async(outliers_request),
+        *[ops.get_column_stats_async(stats_request) for _ in range(6)],
+    )
+    
+    # Assert
+    print(f"✅ Async mean: {stats_response.stats.mean}, outliers: {outliers_response.outlier_count}")
+    
+    assert stats_response.stats == ops.get_column_stats(stats_request).stats
+    assert outliers_response.outliers == ops.detect_outliers(outliers_request).outliers
+    assert all(r.stats == stats_response.stats for r in repeated), "Repeated requests should match"
+
+
+def test_get_column_stats_repeated_request_cached(
+    file_loader, temp_excel_path, write_column_workbook
+):
+    """Test repeated identical statistics requests are served from the result cache.
+    
+    Verifies:
+    - Second identical request reports cache_hit=True with the same stats
+    - Rewriting the file (new mtime) recomputes the result
+    """
+    print(f"\n📊 Testing statistics result cache")
+    
+    import os
+    
+    test_file = temp_excel_path / "stats_cache.xlsx"
+    
+    write_column_workbook(test_file, "Amount", [1_000_000.5, 2_000_000.5, 3_000_000.5])
+    
+    ops = StatisticsOperations(file_loader)
+    request = GetColumnStatsRequest(
+        file_path=str(test_file),
+        sheet_name="Data",
+        column="Amount",
+        header_row=0,
+        filters=[]
+    )
+    
+    # Act
+    first = ops.get_column_stats(request)
+    second = ops.get_column_stats(request)
+    
+    # Assert
+    print(f"✅ First cache_hit={first.performance.cache_hit}, second cache_hit={second.performance.cache_hit}")
+    
+    assert first.performance.cache_hit is False
+    assert second.performance.cache_hit is True, "Identical request should hit result cache"
+    assert second.stats == first.stats
+    
+    # Rewrite file with different data and bump mtime
+    write_column_workbook(test_file, "Amount", [10_000_000.5, 20_000_000.5, 30_000_000.5])
+    stat = test_file.stat()
+    os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    third = ops.get_column_stats(request)
+    print(f"✅ After rewrite: mean={third.stats.mean}")
+    
+    assert third.performance.cache_hit is False, "Changed file should be recomputed"
+    assert third.stats.mean == 20_000_000.5
+
+
+def test_get_column_stats_cache_dropped_by_invalidate_cache(
+    file_loader, temp_excel_path, write_column_workbook
+):
+    """Test FileLoader invalidation also drops cached statistics results.
+    
+    Verifies:
+    - After a rewrite that keeps the same mtime, invalidate_cache() gives fresh stats
+    - clear_cache() also forces a recompute
+    """
+    print(f"\n📊 Testing statistics result cache after invalidate_cache")
+    
+    import os
+    
+    test_file = temp_excel_path / "stats_invalidate.xlsx"
+    
+    write_column_workbook(test_file, "Amount", [1_000_000.5, 2_000_000.5, 3_000_000.5])
+    stat = test_file.stat()
+    
+    ops = StatisticsOperations(file_loader)
+    request = GetColumnStatsRequest(
+        file_path=str(test_file),
+        sheet_name="Data",
+        column="Amount",
+        header_row=0,
+        filters=[]
+    )
+    ops.get_column_stats(request)
+    
+    # Rewrite within the same mtime tick
+    write_column_workbook(test_file, "Amount", [10_000_000.5, 20_000_000.5, 30_000_000.5])
+    os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    
+    # Act
+    file_loader.invalidate_cache(test_file)
+    fresh = ops.get_column_stats(request)
+    file_loader.clear_cache()
+    cleared = ops.get_column_stats(request)
+    
+    # Assert
+    print(f"✅ After invalidate_cache: mean={fresh.stats.mean}, cache_hit={fresh.performance.cache_hit}")
+    
+    assert fresh.performance.cache_hit is False, "invalidate_cache should drop cached results"
+    assert fresh.stats.mean == 20_000_000.5, f"Expected fresh mean, got {fresh.stats.mean}"
+    assert cleared.performance.cache_hit is False, "clear_cache should drop cached results"
@@ -16,6 +16,7 @@ FileLoader -> HeaderDetector -> TimeSeriesOperations -> Response
 
 import pytest
 
+from mcp_excel.core.file_loader import FileLoader
 from mcp_excel.operations.timeseries import TimeSeriesOperations
 from mcp_excel.models.requests import (
     CalculatePeriodChangeRequest,
@@ -1062,3 +1063,477 @@ def test_calculate_moving_average_nested_filters(with_dates_fixture, file_loader
     print(f"✅ Moving average with negated group: {len(response.rows)} rows")
     
     assert len(response.rows) >= 0, "Should calculate moving average"
+
+
+def test_calculate_running_total_numeric_only_rows(file_loader, temp_excel_path):
+    """Test calculate_running_total rows and TSV on an all-numeric sheet.
+    
+    Verifies:
+    - Whole-number floats are returned as ints in every column
+    - Fractional values stay floats
+    - TSV rows match the structured rows
+    """
+    print(f"\n📈 Testing calculate_running_total on all-numeric sheet")
+    
+    import openpyxl
+    
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Order", "Amount"])
+    for i in range(1, 6):
+        ws.append([i * 10_000_000, i * 10_000_000 + 0.5])
+    
+    test_file = temp_excel_path / "numeric_running_total.xlsx"
+    wb.save(test_file)
+    
+    ops = TimeSeriesOperations(file_loader)
+    request = CalculateRunningTotalRequest(
+        file_path=str(test_file),
+        sheet_name="Data",
+        order_column="Order",
+        value_column="Amount"
+    )
+    
+    # Act
+    response = ops.calculate_running_total(request)
+    
+    # Assert
+    print(f"✅ First row: {response.rows[0]}")
+    
+    assert len(response.rows) == 5, f"Expected 5 rows, got {len(response.rows)}"
+    first = response.rows[0]
+    assert first["Order"] == 10_000_000 and isinstance(first["Order"], int), "Order should be int"
+    assert first["Amount"] == 10_000_000.5, f"Expected 10000000.5, got {first['Amount']}"
+    assert response.rows[1]["running_total"] == 30_000_001, "Whole running total should be int"
+    assert isinstance(response.rows[1]["running_total"], int), "Whole running total should be int"
+    
+    tsv_lines = response.excel_output.tsv.split("\n")
+    assert tsv_lines[0] == "Order\tAmount\trunning_total", f"Unexpected header: {tsv_lines[0]}"
+    assert tsv_lines[2] == "20000000\t20000000.5\t30000001", f"Unexpected TSV row: {tsv_lines[2]}"
+
+
+def test_calculate_period_change_text_stored_values(file_loader, temp_excel_path):
+    """Test calculate_period_change with numbers stored as text.
+    
+    Verifies:
+    - Text values are converted to numbers before aggregation
+    - Non-numeric text is ignored in period sums
+    - Changes are calculated from the converted sums
+    """
+    print(f"\n📊 Testing calculate_period_change with text-stored values")
+    
+    import openpyxl
+    from datetime import datetime
+    
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Date", "Amount"])
+    ws.append([datetime(2024, 1, 5), "10000000"])
+    ws.append([datetime(2024, 1, 20), "20000000"])
+    ws.append([datetime(2024, 2, 3), "n/a"])
+    ws.append([datetime(2024, 2, 10), "60000000"])
+    
+    test_file = temp_excel_path / "text_period_change.xlsx"
+    wb.save(test_file)
+    
+    ops = TimeSeriesOperations(file_loader)
+    request = CalculatePeriodChangeRequest(
+        file_path=str(test_file),
+        sheet_name="Data",
+        date_column="Date",
+        value_column="Amount",
+        period_type="month"
+    )
+    
+    # Act
+    response = ops.calculate_period_change(request)
+    
+    # Assert
+    print(f"✅ Periods: {response.periods}")
+    
+    assert [p["period"] for p in response.periods] == ["2024-01", "2024-02"], "Should have two months"
+    assert response.periods[0]["value"] == 30_000_000, f"Expected 30000000, got {response.periods[0]['value']}"
+    assert response.periods[1]["value"] == 60_000_000, f"Expected 60000000, got {response.periods[1]['value']}"
+    assert response.periods[1]["change_absolute"] == 30_000_000, "Absolute change should be 30000000"
+    assert response.periods[1]["change_percent"] == 100, "Percent change should be 100"
+
+
+def test_calculate_period_change_tz_aware_text_dates(file_loader, temp_excel_path):
+    """Test calculate_period_change with text dates that carry a UTC offset.
+
+    Verifies:
+    - Offset text dates (parsed as tz-aware) are bucketed without errors
+    - Periods follow local wall time, like dt.to_period()
+    - Unparseable dates are skipped
+    """
+    print(f"\n📊 Testing calculate_period_change with tz-aware text dates")
+
+    import openpyxl
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Date", "Amount"])
+    ws.append(["2024-01-05T10:00:00+02:00", 10_000_000])
+    ws.append(["2024-01-20T10:00:00+02:00", 20_000_000])
+    ws.append(["2024-02-01T01:00:00+02:00", 40_000_000])  # Still January in UTC
+    ws.append(["not a date", 5])
+    ws.append(["2024-02-10T10:00:00+02:00", 20_000_000])
+
+    test_file = temp_excel_path / "tz_period_change.xlsx"
+    wb.save(test_file)
+
+    ops = TimeSeriesOperations(file_loader)
+    request = CalculatePeriodChangeRequest(
+        file_path=str(test_file),
+        sheet_name="Data",
+        date_column="Date",
+        value_column="Amount",
+        period_type="month"
+    )
+
+    # Act
+    response = ops.calculate_period_change(request)
+
+    # Assert
+    print(f"✅ Periods: {response.periods}")
+
+    assert [p["period"] for p in response.periods] == ["2024-01", "2024-02"], "Should have two months"
+    assert response.periods[0]["value"] == 30_000_000, f"Expected 30000000, got {response.periods[0]['value']}"
+    assert response.periods[1]["value"] == 60_000_000, f"Expected 60000000, got {response.periods[1]['value']}"
+    assert response.periods[1]["change_percent"] == 100, "Percent change should be 100"
+
+
+def test_calculate_moving_average_integer_column(file_loader, temp_excel_path):
+    """Test calculate_moving_average on an integer column.
+    
+    Verifies:
+    - Integer columns (prefix-sum path) give the same averages as pandas rolling
+    - Window larger than the row count averages everything seen so far
+    """
+    print(f"\n📊 Testing calculate_moving_average on integer column")
+    
+    import openpyxl
+    import pandas as pd
+    
+    amounts = [30_000_000, 10_000_000, 20_000_000, 50_000_000, 40_000_000]
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Order", "Amount"])
+    for i, amount in enumerate(amounts, start=1):
+        ws.append([i * 10_000_000, amount])
+    
+    test_file = temp_excel_path / "integer_moving_average.xlsx"
+    wb.save(test_file)
+    
+    ops = TimeSeriesOperations(file_loader)
+    
+    for window_size in (2, 10):
+        request = CalculateMovingAverageRequest(
+            file_path=str(test_file),
+            sheet_name="Data",
+            order_column="Order",
+            value_column="Amount",
+            window_size=window_size
+        )
+        
+        # Act
+        response = ops.calculate_moving_average(request)
+        
+        # Assert
+        expected = pd.Series(amounts).rolling(window_size, min_periods=1).mean().tolist()
+        actual = [row["moving_average"] for row in response.rows]
+        print(f"✅ Window {window_size}: {actual}")
+        
+        assert actual == expected, f"Window {window_size}: expected {expected}, got {actual}"
+
+
+def test_calculate_moving_average_whole_float_column(file_loader, temp_excel_path):
+    """Test calculate_moving_average on whole numbers loaded as floats.
+    
+    Verifies:
+    - A column with a blank cell (float64) filtered to its values gives the
+      same averages as pandas rolling
+    """
+    print(f"\n📊 Testing calculate_moving_average on whole-number float column")
+    
+    import openpyxl
+    import pandas as pd
+    
+    amounts = [30_000_000, None, 10_000_000, 20_000_000, 50_000_000]
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Order", "Amount"])
+    for i, amount in enumerate(amounts, start=1):
+        ws.append([i * 10_000_000, amount])
+    
+    test_file = temp_excel_path / "whole_float_moving_average.xlsx"
+    wb.save(test_file)
+    
+    ops = TimeSeriesOperations(file_loader)
+    request = CalculateMovingAverageRequest(
+        file_path=str(test_file),
+        sheet_name="Data",
+        order_column="Order",
+        value_column="Amount",
+        window_size=3,
+        filters=[FilterCondition(column="Amount", operator="is_not_null")]
+    )
+    
+    # Act
+    response = ops.calculate_moving_average(request)
+    
+    # Assert
+    values = [amount for amount in amounts if amount is not None]
+    expected = pd.Series(values, dtype=float).rolling(3, min_periods=1).mean().tolist()
+    actual = [row["moving_average"] for row in response.rows]
+    print(f"✅ Moving averages: {actual}")
+    
+    assert actual == expected, f"Expected {expected}, got {actual}"
+
+
+def test_calculate_running_total_keeps_loaded_frame(file_loader, temp_excel_path):
+    """Test calculate_running_total does not modify the cached DataFrame.
+    
+    Verifies:
+    - Text-stored values are summed as numbers
+    - The cached sheet still matches a fresh load (no added or converted columns)
+    """
+    print(f"\n📈 Testing calculate_running_total leaves cached data intact")
+    
+    import openpyxl
+    
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Order", "Amount"])
+    for i in (3, 1, 2):
+        ws.append([i * 10_000_000, str(i * 10_000_000)])
+    
+    test_file = temp_excel_path / "running_total_cache.xlsx"
+    wb.save(test_file)
+    
+    ops = TimeSeriesOperations(file_loader)
+    request = CalculateRunningTotalRequest(
+        file_path=str(test_file),
+        sheet_name="Data",
+        order_column="Order",
+        value_column="Amount"
+    )
+    
+    # Act
+    response = ops.calculate_running_total(request)
+    cached_df = file_loader.load(str(test_file), "Data", header_row=0)
+    fresh_df = FileLoader().load(str(test_file), "Data", header_row=0)
+    
+    # Assert
+    print(f"✅ Running totals: {[row['running_total'] for row in response.rows]}")
+    
+    assert [row["running_total"] for row in response.rows] == [10_000_000, 30_000_000, 60_000_000], \
+        "Running total should follow the order column"
+    assert list(cached_df.columns) == ["Order", "Amount"], "Cached frame should not gain columns"
+    assert cached_df.equals(fresh_df), "Cached frame should match a fresh load"
+    assert response.metadata.columns_total == 3, "Metadata should count the running_total column"
+
+
+def test_calculate_period_change_keeps_loaded_frame(with_dates_fixture):
+    """Test calculate_period_change does not add a period column to cached data.
+    
+    Verifies:
+    - Periods are computed for every period type
+    - The cached sheet has no leftover 'period' column for later operations
+    """
+    print(f"\n📊 Testing calculate_period_change leaves cached data intact")
+    
+    loader = FileLoader()
+    ops = TimeSeriesOperations(loader)
+    
+    for period_type in ("month", "quarter", "year"):
+        request = CalculatePeriodChangeRequest(
+            file_path=with_dates_fixture.path_str,
+            sheet_name=with_dates_fixture.sheet_name,
+            date_column="Дата заказа",
+            value_column="Сумма",
+            period_type=period_type
+        )
+        
+        # Act
+        response = ops.calculate_period_change(request)
+        print(f"✅ {period_type}: {[p['period'] for p in response.periods][:3]}")
+        
+        # Assert
+        assert len(response.periods) > 0, f"Should return {period_type} periods"
+    
+    df, _ = ops._load_with_header_detection(with_dates_fixture.path_str, with_dates_fixture.sheet_name, None)
+    assert "period" not in df.columns, "Cached frame should not gain a period column"
+
+
+def test_calculate_running_total_text_order_ties_keep_file_order(file_loader, temp_excel_path):
+    """Test calculate_running_total sorts text order columns stably.
+    
+    Verifies:
+    - Rows are ordered by the text order column
+    - Rows with equal order values keep their original file order
+    """
+    print(f"\n📈 Testing calculate_running_total stable sort on text column")
+    
+    import openpyxl
+    
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Region", "Amount"])
+    for i in range(40):
+        ws.append(["Север" if i % 2 else "Юг", (i + 1) * 10_000_000])
+    
+    test_file = temp_excel_path / "text_order_ties.xlsx"
+    wb.save(test_file)
+    
+    ops = TimeSeriesOperations(file_loader)
+    request = CalculateRunningTotalRequest(
+        file_path=str(test_file),
+        sheet_name="Data",
+        order_column="Region",
+        value_column="Amount"
+    )
+    
+    # Act
+    response = ops.calculate_running_total(request)
+    
+    # Assert
+    regions = [row["Region"] for row in response.rows]
+    amounts = [row["Amount"] for row in response.rows]
+    print(f"✅ First rows: {response.rows[:2]}")
+    
+    assert regions == ["Север"] * 20 + ["Юг"] * 20, "Rows should be ordered by region"
+    assert amounts[:20] == sorted(amounts[:20]), "Tied rows should keep file order"
+    assert amounts[20:] == sorted(amounts[20:]), "Tied rows should keep file order"
+
+
+def test_calculate_running_total_grouped_missing_values(file_loader, temp_excel_path):
+    """Test grouped calculate_running_total with missing values and group keys.
+    
+    Verifies:
+    - Each group accumulates its own running total
+    - Missing values and missing group keys produce empty running totals
+    """
+    print(f"\n📈 Testing grouped running total with missing values")
+    
+    import openpyxl
+    
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Order", "Group", "Amount"])
+    expected = []
+    totals = {}
+    for i in range(60):
+        group = None if i % 11 == 0 else f"G{i % 4}"
+        amount = None if i % 7 == 0 else (i + 1) * 10_000_000
+        ws.append([(i + 1) * 10_000_000, group, amount])
+        if group is None or amount is None:
+            expected.append(None)
+        else:
+            totals[group] = totals.get(group, 0) + amount
+            expected.append(totals[group])
+    
+    test_file = temp_excel_path / "grouped_missing.xlsx"
+    wb.save(test_file)
+    
+    ops = TimeSeriesOperations(file_loader)
+    request = CalculateRunningTotalRequest(
+        file_path=str(test_file),
+        sheet_name="Data",
+        order_column="Order",
+        value_column="Amount",
+        group_by_columns=["Group"]
+    )
+    
+    # Act
+    response = ops.calculate_running_total(request)
+    
+    # Assert
+    running_totals = [row["running_total"] for row in response.rows]
+    print(f"✅ First totals: {running_totals[:5]}")
+    
+    assert running_totals == expected, "Running totals should accumulate per group"
+    assert running_totals[0] is None, "Missing value/key should give empty total"
+
+
+def test_calculate_period_change_single_period(file_loader, temp_excel_path):
+    """Test calculate_period_change when all rows fall into one period.
+    
+    Verifies:
+    - One period is returned with its summed value
+    - First period has no absolute or percent change
+    """
+    print(f"\n📊 Testing calculate_period_change with a single period")
+    
+    import openpyxl
+    from datetime import datetime
+    
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Date", "Amount"])
+    ws.append([datetime(2024, 3, 1), 10_000_000])
+    ws.append([datetime(2024, 3, 31), 25_000_000])
+    
+    test_file = temp_excel_path / "single_period.xlsx"
+    wb.save(test_file)
+    
+    ops = TimeSeriesOperations(file_loader)
+    request = CalculatePeriodChangeRequest(
+        file_path=str(test_file),
+        sheet_name="Data",
+        date_column="Date",
+        value_column="Amount",
+        period_type="quarter"
+    )
+    
+    # Act
+    response = ops.calculate_period_change(request)
+    
+    # Assert
+    print(f"✅ Periods: {response.periods}")
+    
+    assert response.periods == [{
+        "period": "2024Q1",
+        "value": 35_000_000,
+        "change_absolute": None,
+        "change_percent": None,
+    }], f"Unexpected periods: {response.periods}"
+
+
+def test_calendar_ordinals_match_datetime64_cast():
+    """Test period bucketing ordinals against NumPy's datetime64 casts.
+    
+    Verifies:
+    - Lookup-table path (narrow date range) matches the direct cast
+    - Dates before 1970 and times of day land in the right month/year
+    - Wide date ranges (direct cast fallback) and empty input work
+    """
+    print(f"\n📅 Testing calendar ordinals")
+    
+    import numpy as np
+    from mcp_excel.operations.timeseries import _calendar_ordinals
+    
+    narrow = np.array(
+        ["1969-12-31T23:59:59", "1970-01-01", "2024-02-29T12:00", "2024-03-01", "1999-12-31T23:00"] * 3000,
+        dtype="datetime64[ns]",
+    )
+    wide = np.array(["1700-01-01", "2200-06-15", "1969-07-20"], dtype="datetime64[ns]")
+    
+    for dates in (narrow, wide):
+        for unit in ("M", "Y"):
+            expected = dates.astype(f"datetime64[{unit}]").view(np.int64)
+            actual = _calendar_ordinals(dates, unit)
+            print(f"✅ {len(dates)} dates, unit {unit}: {actual[:5].tolist()}")
+            assert np.array_equal(actual, expected), f"Ordinals should match datetime64[{unit}] cast"
+    
+    empty = _calendar_ordinals(np.array([], dtype="datetime64[ns]"), "M")
+    assert len(empty) == 0, "Empty input should give no ordinals"
@@ -913,3 +913,56 @@ def test_find_duplicates_performance_metrics(with_duplicates_fixture, file_loade
     assert response.performance.rows_processed == with_duplicates_fixture.row_count, "Should process all rows"
     assert response.performance.cache_hit in [True, False], "Should report cache status"
     assert response.performance.memory_used_mb >= 0, "Should report memory usage"
+
+
+def test_find_duplicates_tsv_matches_rows(with_duplicates_fixture, file_loader):
+    """Test find_duplicates TSV rows line up with the duplicate dicts.
+    
+    Verifies:
+    - TSV starts with the _row_index column
+    - Each TSV row carries the same row index as the matching dict
+    """
+    print(f"\n📂 Testing find_duplicates TSV against rows")
+    
+    ops = ValidationOperations(file_loader)
+    
+    request = FindDuplicatesRequest(
+        file_path=with_duplicates_fixture.path_str,
+        sheet_name=with_duplicates_fixture.sheet_name,
+        columns=[with_duplicates_fixture.columns[0]]
+    )
+    
+    # Act
+    response = ops.find_duplicates(request)
+    
+    # Assert
+    lines = response.excel_output.tsv.split("\n")
+    print(f"✅ TSV header: {lines[0]}")
+    
+    assert lines[0].split("\t")[0] == "_row_index", "TSV should start with row index column"
+    assert len(lines) - 1 == response.duplicate_count, "TSV should have one line per duplicate"
+    for line, dup in zip(lines[1:], response.duplicates):
+        assert line.split("\t")[0] == str(dup["_row_index"]), "TSV row index should match dict"
+
+
+def test_find_duplicates_oversized_result_rejected(large_10k_fixture, file_loader):
+    """Test find_duplicates rejects results beyond the response limit.
+    
+    Verifies:
+    - Thousands of duplicate rows raise the context overflow error
+    """
+    print(f"\n📂 Testing find_duplicates oversized result on: {large_10k_fixture.name}")
+    
+    ops = ValidationOperations(file_loader)
+    
+    request = FindDuplicatesRequest(
+        file_path=large_10k_fixture.path_str,
+        sheet_name=large_10k_fixture.sheet_name,
+        columns=["Customer"]
+    )
+    
+    # Act & Assert
+    with pytest.raises(ValueError, match="Response too large"):
+        ops.find_duplicates(request)
+    
+    print(f"✅ Oversized duplicate result rejected")
@@ -69,6 +69,25 @@ def test_get_column_stats_basic(mcp_call_tool, numeric_types_fixture):
     print(f"  ✅ Stats: count={stats['count']}, mean={stats.get('mean')}, median={stats.get('median')}")
 
 
+def test_get_column_stats_missing_column_error(mcp_call_tool, numeric_types_fixture):
+    """Smoke: missing column is reported as a ValueError payload."""
+    print(f"\n📊 Testing get_column_stats with missing column...")
+    
+    result = mcp_call_tool("get_column_stats", {
+        "file_path": str(numeric_types_fixture.path_str),
+        "sheet_name": numeric_types_fixture.sheet_name,
+        "column": "NonExistentColumn12345XYZ"
+    })
+    
+    error_text = result["raw_text"]
+    print(f"  Error payload: {error_text[:100]}...")
+    
+    assert "'error': 'ValueError'" in error_text, "Missing column should keep the ValueError type"
+    assert "NonExistentColumn12345XYZ" in error_text, "Message should name the missing column"
+    
+    print(f"  ✅ Missing column reported as ValueError")
+
+
 # ============================================================================
 # STATISTICS TESTS - CORRELATE
 # ============================================================================
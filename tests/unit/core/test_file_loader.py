@@ -7,7 +7,7 @@
 
 Tests cover:
 - File loading (.xlsx and .xls formats)
-- Caching mechanism (LRU cache)
+- Caching mechanism (LRU cache, detected header rows)
 - Sheet name retrieval
 - File info extraction
 - Header row parameter handling
@@ -169,6 +169,25 @@ def test_load_without_datetime_conversion(with_dates_fixture, file_loader):
     # The key is that we're testing the convert_dates parameter works
 
 
+def test_extract_cell_formats_xlsx(with_dates_fixture, file_loader):
+    """Test number formats are read from .xlsx cells.
+    
+    Verifies:
+    - The workbook opens and closes without error (formats are returned)
+    - Date-formatted columns report their number format
+    """
+    print(f"\n📂 Extracting cell formats from: {with_dates_fixture.path_str}")
+    
+    # Act
+    formats = file_loader._extract_cell_formats_xlsx(with_dates_fixture.path, with_dates_fixture.sheet_name)
+    
+    # Assert
+    print(f"✅ Formats: {formats}")
+    
+    assert formats, "Should return formats for date columns"
+    assert all(isinstance(f, list) and f for f in formats.values()), "Each column should list its formats"
+
+
 def test_cache_hit_on_second_load(simple_fixture, file_loader):
     """Test that cache is used on second load of same file.
     
@@ -265,6 +284,36 @@ def test_cache_invalidation(simple_fixture, file_loader):
     assert stats_after['size'] < stats_before['size'], "Cache size should decrease after invalidation"
 
 
+def test_cache_memory_check_reuses_reading(simple_fixture, monkeypatch, count_calls):
+    """Test cache lookups share a recent process memory reading.
+    
+    Verifies:
+    - Repeated loads within MEMORY_CHECK_INTERVAL call memory_info() once
+    - A new reading is taken once the interval has passed
+    """
+    print(f"\n📂 Testing cache memory check sampling")
+    
+    from mcp_excel.core import cache
+    from mcp_excel.core.file_loader import FileLoader
+    
+    loader = FileLoader(cache=cache.FileCache())
+    monkeypatch.setattr(cache, "_memory_checked_at", None)  # Start without a shared reading
+    calls = count_calls(cache._process, "memory_info")
+    
+    # Act
+    for _ in range(3):
+        loader.load(simple_fixture.path_str, simple_fixture.sheet_name, header_row=0)
+    calls_in_burst = len(calls)
+    monkeypatch.setattr(cache, "MEMORY_CHECK_INTERVAL", 0.0)
+    loader.load(simple_fixture.path_str, simple_fixture.sheet_name, header_row=0)
+    
+    # Assert
+    print(f"   memory_info() calls: burst={calls_in_burst}, total={len(calls)}")
+    
+    assert calls_in_burst == 1, f"Burst of lookups should share one reading, got {calls_in_burst}"
+    assert len(calls) == 2, "Expired reading should be refreshed"
+
+
 def test_get_sheet_names(simple_fixture, file_loader):
     """Test retrieving sheet names from file.
     
@@ -287,6 +336,101 @@ def test_get_sheet_names(simple_fixture, file_loader):
     assert all(len(name) > 0 for name in sheet_names), "Sheet names should not be empty"
 
 
+def test_get_sheet_names_reflects_file_changes(temp_excel_path, file_loader):
+    """Test that memoized sheet names are refreshed when the file changes.
+    
+    Verifies:
+    - Repeated calls return the same sheet names
+    - Rewriting the file with new sheets is picked up (cache keyed by mtime/size)
+    """
+    print(f"\n📂 Testing sheet names refresh after file change")
+    
+    import os
+    import pandas as pd
+    
+    file_path = temp_excel_path / "sheets.xlsx"
+    with pd.ExcelWriter(file_path, engine="openpyxl") as writer:
+        pd.DataFrame({"A": [1]}).to_excel(writer, sheet_name="First", index=False)
+    
+    assert file_loader.get_sheet_names(file_path) == ["First"]
+    assert file_loader.get_sheet_names(file_path) == ["First"], "Second call should match"
+    
+    with pd.ExcelWriter(file_path, engine="openpyxl") as writer:
+        pd.DataFrame({"A": [1]}).to_excel(writer, sheet_name="First", index=False)
+        pd.DataFrame({"B": [2]}).to_excel(writer, sheet_name="Second", index=False)
+    # Bump mtime explicitly in case the filesystem timestamp resolution is coarse
+    stat = file_path.stat()
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    sheet_names = file_loader.get_sheet_names(file_path)
+    print(f"✅ Sheet names after rewrite: {sheet_names}")
+    
+    assert sheet_names == ["First", "Second"], "Should pick up new sheet after file change"
+
+
+def test_detected_header_memo(temp_excel_path, file_loader):
+    """Test remembered auto-detected header rows.
+
+    Verifies:
+    - A remembered header row is returned for the same file and sheet
+    - Modifying the file forgets it (key includes mtime)
+    - invalidate_cache() forgets it
+    """
+    print(f"\n📂 Testing detected header memo")
+
+    import os
+    import pandas as pd
+
+    file_path = temp_excel_path / "headers.xlsx"
+    pd.DataFrame({"A": [1]}).to_excel(file_path, sheet_name="Data", index=False)
+
+    assert file_loader.get_detected_header(file_path, "Data") is None, "Nothing detected yet"
+    file_loader.remember_detected_header(file_path, "Data", 2)
+    assert file_loader.get_detected_header(str(file_path), "Data") == 2, "Should return remembered row"
+    assert file_loader.get_detected_header(file_path, "Other") is None, "Other sheets are separate"
+
+    # Bump mtime explicitly in case the filesystem timestamp resolution is coarse
+    stat = file_path.stat()
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert file_loader.get_detected_header(file_path, "Data") is None, "File change should forget the row"
+
+    file_loader.remember_detected_header(file_path, "Data", 1)
+    file_loader.invalidate_cache(file_path)
+
+    print(f"✅ After invalidation: {file_loader.get_detected_header(file_path, 'Data')}")
+
+    assert file_loader.get_detected_header(file_path, "Data") is None, "invalidate_cache should forget the row"
+
+
+def test_detected_header_memo_resolves_paths(temp_excel_path, file_loader, monkeypatch):
+    """Test remembered header rows are shared by relative and symlinked paths.
+    
+    Verifies:
+    - A row remembered via a relative path is found via the absolute path
+    - Invalidating via the absolute path forgets a row remembered via a symlink
+    """
+    print(f"\n📂 Testing detected header memo path resolution")
+    
+    import os
+    import pandas as pd
+    
+    file_path = temp_excel_path / "headers.xlsx"
+    pd.DataFrame({"A": [1]}).to_excel(file_path, sheet_name="Data", index=False)
+    link_path = temp_excel_path / "link.xlsx"
+    os.symlink(file_path, link_path)
+    monkeypatch.chdir(temp_excel_path)
+    
+    file_loader.remember_detected_header("headers.xlsx", "Data", 2)
+    assert file_loader.get_detected_header(file_path, "Data") == 2, "Relative path should share the entry"
+    
+    file_loader.remember_detected_header(link_path, "Data", 3)
+    file_loader.invalidate_cache(file_path)
+    
+    print(f"✅ After invalidation: {file_loader.get_detected_header(link_path, 'Data')}")
+    
+    assert file_loader.get_detected_header(link_path, "Data") is None, "Symlinked entry should be forgotten"
+
+
 def test_get_file_info(simple_fixture, file_loader):
     """Test retrieving file information.
     
@@ -452,3 +596,53 @@ def test_cache_key_includes_convert_dates(with_dates_fixture, file_loader):
     
     # Assert
     assert stats_after_second['size'] > stats_after_first['size'], "Should create separate cache entry"
+
+
+def test_detected_header_load_cache_entries(messy_headers_fixture, file_loader):
+    """Test the cache entries left by a header-detection style load.
+    
+    Verifies:
+    - Raw preview (no dates) and dated header view are the only entries
+    """
+    print(f"\n📂 Testing cache entries for preview + header load")
+    
+    file_loader.clear_cache()
+    path = messy_headers_fixture.path_str
+    sheet = messy_headers_fixture.sheet_name
+    
+    file_loader.load(path, sheet, header_row=None, convert_dates=False)
+    file_loader.load(path, sheet, header_row=messy_headers_fixture.header_row)
+    stats = file_loader.get_cache_stats()
+    print(f"✅ Cache: {stats}")
+    
+    assert stats['size'] == 2, f"Expected 2 cache entries, got {stats['size']}"
+
+
+def test_header_view_keeps_na_like_column_names(temp_excel_path, file_loader):
+    """Test header views keep column names that pandas treats as NA values.
+    
+    Verifies:
+    - Header cells like "NA", "N/A", "None", "null" and "nan" stay column names
+      after the sheet was loaded raw (they are not renamed to "Unnamed: N")
+    - NA-like data cells are still read as missing values
+    """
+    print(f"\n📂 Testing header view with NA-like column names")
+    
+    import openpyxl
+    import pandas as pd
+    
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Region", "NA", "EU", "N/A", "None", "null", "nan"])
+    ws.append(["North", 1, 2, 3, 4, 5, 6])
+    ws.append(["South", "NA", 7, 8, 9, 10, 11])
+    test_file = temp_excel_path / "na_headers.xlsx"
+    wb.save(test_file)
+    
+    file_loader.load(str(test_file), "Data", header_row=None)
+    df = file_loader.load(str(test_file), "Data", header_row=0)
+    print(f"✅ Columns: {list(df.columns)}")
+    
+    assert list(df.columns) == ["Region", "NA", "EU", "N/A", "None", "null", "nan"], "NA-like names should be kept"
+    assert pd.isna(df["NA"].iloc[1]), "NA-like data cells should still be missing"
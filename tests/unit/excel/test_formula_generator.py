@@ -18,7 +18,7 @@ Tests cover:
 import pytest
 import pandas as pd
 
-from mcp_excel.excel.formula_generator import FormulaGenerator
+from mcp_excel.excel.formula_generator import MAX_EXCEL_COLUMNS, FormulaGenerator, column_letter
 from mcp_excel.models.requests import FilterCondition
 
 
@@ -151,6 +151,19 @@ def test_column_letter_extended():
     print("✅ Extended column letters (AA-ZZ, AAA) generated correctly")
 
 
+def test_column_letter_table_boundaries():
+    """Test column letters at the edges of the precomputed table."""
+    print("\n📂 Testing column letter table boundaries")
+    
+    gen = FormulaGenerator("Sheet1")
+    
+    assert gen._column_letter(MAX_EXCEL_COLUMNS - 1) == "XFD", "Last Excel column should be XFD"
+    assert gen._column_letter(MAX_EXCEL_COLUMNS) == "XFE", "Beyond the table should still compute"
+    assert column_letter(18277) == "ZZZ", "Index 18277 should be ZZZ"
+    
+    print("✅ Column letters at table boundaries generated correctly")
+
+
 def test_get_column_range():
     """Test Excel range generation."""
     print("\n📂 Testing column range generation")
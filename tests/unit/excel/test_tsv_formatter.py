@@ -6,7 +6,7 @@
 """Unit tests for TSVFormatter component.
 
 Tests cover:
-- Table formatting (headers + rows)
+- Table formatting (headers + rows, or column-oriented)
 - Single value formatting (with/without formula)
 - Key-value pairs formatting
 - Matrix formatting (with row/column labels)
@@ -105,6 +105,73 @@ def test_format_table_cyrillic():
     print(f"✅ Cyrillic table formatted correctly:\n{tsv}")
 
 
+def test_format_table_generator_rows():
+    """Test table formatting with rows supplied as a generator."""
+    print("\n📂 Testing table with generator rows")
+    
+    formatter = TSVFormatter()
+    
+    headers = ["Key", "Value"]
+    records = [{"Key": "A", "Value": 1}, {"Key": "B", "Value": None}]
+    rows = ([record.get(h) for h in headers] for record in records)
+    
+    tsv = formatter.format_table(headers, rows)
+    
+    assert tsv == "Key\tValue\nA\t1\nB\t", "Generator rows should format like a list"
+    
+    print(f"✅ Generator rows formatted correctly:\n{tsv}")
+
+
+def test_format_table_float_format():
+    """Test table formatting with float_format applied to float cells only."""
+    print("\n📂 Testing table with float_format")
+    
+    formatter = TSVFormatter()
+    
+    headers = ["", "X"]
+    rows = [["X", 1.0], ["Y", 0.123456], ["N", 3], ["B", True]]
+    
+    tsv = formatter.format_table(headers, rows, float_format="%.4f")
+    
+    assert tsv == "\tX\nX\t1.0000\nY\t0.1235\nN\t3\nB\tTRUE", \
+        "Only float cells should use float_format"
+    
+    print(f"✅ Float format applied correctly:\n{tsv}")
+
+
+def test_format_columns_matches_format_table():
+    """Test column-oriented formatting gives the same TSV as row-oriented."""
+    print("\n📂 Testing format_columns against format_table")
+    
+    formatter = TSVFormatter()
+    
+    headers = ["Name", "Age", "Active", "Note"]
+    columns = [
+        ["Alice", "Bob", None],
+        [25, 30.5, None],
+        [True, False, None],
+        ["a\tb", "line\nbreak", ""]
+    ]
+    
+    tsv = formatter.format_columns(headers, columns)
+    
+    assert tsv == formatter.format_table(headers, zip(*columns)), "Should match row-oriented output"
+    assert tsv.split("\n")[1] == "Alice\t25\tTRUE\ta b", "Cells should be formatted and escaped"
+    
+    print(f"✅ Columns formatted correctly:\n{tsv}")
+
+
+def test_format_columns_empty_columns():
+    """Test column-oriented formatting with no data rows."""
+    print("\n📂 Testing format_columns with empty columns")
+    
+    formatter = TSVFormatter()
+    
+    tsv = formatter.format_columns(["Name", "Age"], [[], []])
+    
+    assert tsv == "Name\tAge", "Should only have header line"
+    print(f"✅ Empty columns formatted correctly: {tsv}")
+
 # ============================================================================
 # SINGLE VALUE FORMATTING TESTS
 # ============================================================================
@@ -16,6 +16,7 @@ import pytest
 import pandas as pd
 from pydantic import BaseModel
 
+from mcp_excel.core.file_loader import FileLoader
 from mcp_excel.operations.base import (
     BaseOperations,
     DEFAULT_COLUMN_LIMIT,
@@ -192,6 +193,29 @@ def test_validate_response_size_suggests_fewer_columns(file_loader):
     assert str(DEFAULT_COLUMN_LIMIT) in error_msg, "Should mention default column limit"
 
 
+def test_validate_tsv_size(file_loader):
+    """Test _validate_tsv_size fails fast on oversized TSV output.
+    
+    Verifies:
+    - No error raised for TSV within the limit
+    - ValueError with the usual size message for TSV over the limit
+    """
+    print("\n📏 Testing TSV size validation")
+    
+    ops = BaseOperations(file_loader)
+    
+    ops._validate_tsv_size("a\tb\n1\t2", rows_count=1, columns_count=2)
+    
+    with pytest.raises(ValueError) as exc_info:
+        ops._validate_tsv_size("x" * (MAX_RESPONSE_CHARS + 1), rows_count=5000, columns_count=3)
+    
+    error_msg = str(exc_info.value)
+    print(f"  ✅ Error: {error_msg[:80]}...")
+    
+    assert "Response too large" in error_msg, "Should explain the response is too large"
+    assert "5000 rows × 3 columns" in error_msg, "Should mention rows and columns"
+
+
 # ============================================================================
 # Test Column Limit Application (Smart Defaults)
 # ============================================================================
@@ -486,6 +510,33 @@ def test_ensure_numeric_column_non_convertible(file_loader):
     assert "1/5" in error_msg or "1" in error_msg, "Should show conversion stats"
 
 
+def test_ensure_numeric_column_large_column_sample_probe(file_loader):
+    """Test _ensure_numeric_column sample probe on columns above NUMERIC_PROBE_SIZE.
+    
+    Verifies:
+    - Large text column is rejected from the head sample
+    - Large column of text-stored numbers is still fully converted
+    """
+    print("\n🔢 Testing numeric column conversion - large column sample probe")
+    
+    from mcp_excel.operations.base import NUMERIC_PROBE_SIZE
+    
+    ops = BaseOperations(file_loader)
+    size = NUMERIC_PROBE_SIZE * 2
+    
+    text_data = pd.Series([f"item_{i}" for i in range(size)], dtype='object')
+    with pytest.raises(ValueError) as exc_info:
+        ops._ensure_numeric_column(text_data, "TextColumn")
+    print(f"  ✅ Text column rejected: {exc_info.value}")
+    assert "sampled" in str(exc_info.value), "Should be rejected by the sample probe"
+    
+    number_data = pd.Series([str(i) for i in range(size)], dtype='object')
+    result = ops._ensure_numeric_column(number_data, "NumberColumn")
+    print(f"  ✅ Numeric text converted: {len(result)} values")
+    assert result.notna().sum() == size, "All values should be converted"
+    assert result.iloc[-1] == size - 1
+
+
 def test_ensure_numeric_column_datetime_type(file_loader):
     """Test _ensure_numeric_column with datetime column.
     
@@ -1132,3 +1183,230 @@ def test_add_sample_rows_formats_integers(file_loader):
     # Verify Value with decimal stays float
     assert result[0]["Value"] == 100.5, "Value 100.5 should stay float"
     assert isinstance(result[0]["Value"], float), "Value 100.5 should be float type"
+
+
+# ============================================================================
+# _FORMAT_RECORDS TESTS
+# ============================================================================
+
+def test_format_records_matches_format_value(file_loader):
+    """Test _format_records gives the same output as per-cell _format_value.
+    
+    Verifies:
+    - Integers, floats, booleans, strings and datetimes are formatted column-wise
+    - Whole floats become int, NaN/NaT/None become None
+    - Result equals the row-by-row _format_value conversion
+    """
+    print("\n🔍 Testing _format_records matches _format_value")
+    
+    ops = BaseOperations(file_loader)
+    df = pd.DataFrame({
+        "Int": [1, 2, 3],
+        "Float": [1.0, 2.5, float("nan")],
+        "Text": ["a", None, "c"],
+        "Date": pd.to_datetime(["2024-01-15 00:00", None, "2024-03-01 12:30"]),
+        "Flag": [True, False, True],
+    })
+    
+    result = ops._format_records(df)
+    expected = [
+        {str(k): ops._format_value(v) for k, v in df.iloc[idx].to_dict().items()}
+        for idx in range(len(df))
+    ]
+    
+    print(f"  Result: {result}")
+    
+    assert result == expected, "Column-wise formatting should match per-cell formatting"
+    assert isinstance(result[0]["Float"], int), "Float 1.0 should be int type"
+    assert result[2]["Float"] is None, "NaN should become None"
+    assert result[1]["Date"] is None, "NaT should become None"
+    assert result[2]["Date"] == "2024-03-01T12:30:00", "Datetime should be ISO 8601"
+
+
+def test_format_records_empty_dataframe(file_loader):
+    """Test _format_records with empty DataFrame.
+    
+    Verifies:
+    - Returns empty list for empty DataFrame
+    - No error raised
+    """
+    print("\n🔍 Testing _format_records with empty DataFrame")
+    
+    ops = BaseOperations(file_loader)
+    df = pd.DataFrame({"A": [], "B": []})
+    
+    result = ops._format_records(df)
+    
+    assert result == [], "Should return empty list"
+
+
+# ============================================================================
+# Test Header Detection Cache
+# ============================================================================
+
+def test_load_with_header_detection_caches_header_row(messy_headers_fixture, count_calls):
+    """Test _load_with_header_detection memoizes the detected header row.
+    
+    Verifies:
+    - First call runs detection and the loader remembers the result
+    - Second call returns the same header row and DataFrame shape without detecting again
+    """
+    print("\n🔎 Testing header detection cache")
+    
+    loader = FileLoader()
+    ops = BaseOperations(loader)
+    path = messy_headers_fixture.path_str
+    sheet = messy_headers_fixture.sheet_name
+    detections = count_calls(ops._header_detector, "detect")
+    
+    df1, header1 = ops._load_with_header_detection(path, sheet, None)
+    assert loader.get_detected_header(path, sheet) == header1, "Detected header row should be remembered"
+    
+    df2, header2 = ops._load_with_header_detection(path, sheet, None)
+    print(f"  ✅ Header row: {header1} (cached: {header2}), detections: {len(detections)}")
+    
+    assert header1 == header2 == messy_headers_fixture.header_row
+    assert df1.shape == df2.shape
+    assert len(detections) == 1, f"Expected 1 detection, got {len(detections)}"
+
+
+def test_header_cache_shared_by_operations_on_same_loader(messy_headers_fixture, count_calls):
+    """Test detected header rows are shared between operations on one loader.
+    
+    Verifies:
+    - A second operations object on the same FileLoader reuses the detection
+    - A different FileLoader has not seen the detection
+    - Clearing the loader cache forgets detected header rows
+    """
+    print("\n🔎 Testing shared header detection cache")
+    
+    loader = FileLoader()
+    other_loader = FileLoader()
+    path, sheet = messy_headers_fixture.path_str, messy_headers_fixture.sheet_name
+    
+    _, header_row = BaseOperations(loader)._load_with_header_detection(path, sheet, None)
+    
+    second = BaseOperations(loader)
+    detections = count_calls(second._header_detector, "detect")
+    _, second_header_row = second._load_with_header_detection(path, sheet, None)
+    
+    print(f"  ✅ Header row: {header_row}, second object: {second_header_row}")
+    
+    assert second_header_row == header_row, "Same loader should reuse the detected row"
+    assert len(detections) == 0, "Second object should not run detection again"
+    assert other_loader.get_detected_header(path, sheet) is None, "Different loader should have its own cache"
+    
+    loader.clear_cache()
+    assert loader.get_detected_header(path, sheet) is None, "clear_cache should forget detected rows"
+
+
+def test_header_detection_skips_date_conversion_on_preview(messy_headers_fixture, count_calls):
+    """Test header detection reads the raw sheet without a date-converted copy.
+    
+    Verifies:
+    - Detected result matches an explicit header_row load
+    - Dates are converted once (for the header view), not for the detection preview
+    """
+    print("\n🔎 Testing header detection preview load")
+    
+    loader = FileLoader()
+    ops = BaseOperations(loader)
+    path, sheet = messy_headers_fixture.path_str, messy_headers_fixture.sheet_name
+    conversions = count_calls(loader, "_convert_datetime_columns")
+    
+    df, header_row = ops._load_with_header_detection(path, sheet, None)
+    expected = FileLoader().load(path, sheet, header_row=header_row)
+    
+    print(f"  ✅ Header row: {header_row}, date conversions: {len(conversions)}")
+    
+    assert list(df.columns) == [str(c) for c in expected.columns], "Columns should match explicit load"
+    assert len(df) == len(expected), "Row count should match explicit load"
+    assert len(conversions) == 1, "Detection preview should not convert dates"
+
+
+def test_format_column_float_edge_values(file_loader):
+    """Test _format_column on float columns with edge values.
+    
+    Verifies:
+    - Whole floats become int, fractional floats stay float
+    - NaN becomes None
+    - Infinity stays float
+    - Whole values beyond int64 range become int, like _format_value
+    """
+    print("\n🔍 Testing _format_column with float edge values")
+    
+    ops = BaseOperations(file_loader)
+    col = pd.Series([3.0, -2.5, float("nan"), float("inf"), 1e20])
+    
+    result = ops._format_column(col)
+    
+    print(f"  Result: {result}")
+    
+    assert result[0] == 3 and isinstance(result[0], int), "Whole float should be int"
+    assert result[1] == -2.5, "Fractional float should stay float"
+    assert result[2] is None, "NaN should become None"
+    assert result[3] == float("inf"), "Infinity should stay float"
+    assert result[4] == 10**20 and isinstance(result[4], int), "Whole values beyond int64 range should be int"
+
+
+@pytest.mark.parametrize("col", [
+    pd.Series([3.0, -2.5, float("nan"), float("inf"), -0.0, 1e20, -2.0**70]),
+    pd.Series([0.1, 2.0, None], dtype="float32"),
+    pd.Series([1, -5, 2**40], dtype="int64"),
+    pd.Series([True, False]),
+    pd.Series([1.0, 2.5, None], dtype="Float64"),
+    pd.Series([1, None], dtype="Int64"),
+    pd.Series(["a", None], dtype="string"),
+    pd.Series(["x", "y", "x"], dtype="category"),
+    pd.Series(["text", 4.0, None, 7], dtype=object),
+    pd.Series(pd.to_datetime(["2024-01-05", None])),
+    pd.Series(pd.to_datetime(["2024-01-05 10:00"]).tz_localize("UTC")),
+], ids=["float64", "float32", "int64", "bool", "Float64", "Int64", "string", "category",
+        "object", "datetime", "datetime_tz"])
+def test_format_column_matches_format_value(file_loader, col):
+    """Test _format_column agrees with _format_value on each tolist() value.
+    
+    Verifies:
+    - Same values and same Python types for NumPy, extension and object dtypes
+    """
+    print(f"\n🔍 Testing _format_column parity for dtype {col.dtype}")
+    
+    ops = BaseOperations(file_loader)
+    
+    result = ops._format_column(col)
+    expected = [ops._format_value(v) for v in col.tolist()]
+    
+    print(f"  Result: {result}")
+    
+    assert result == expected, f"Expected {expected}, got {result}"
+    assert [type(v) for v in result] == [type(v) for v in expected], "Value types should match"
+
+
+def test_get_performance_metrics_reuses_memory_sample(file_loader, monkeypatch, count_calls):
+    """Test _get_performance_metrics reuses a recent RSS reading.
+    
+    Verifies:
+    - Calls within MEMORY_CHECK_INTERVAL share one memory_info() reading
+    - A new reading is taken once the interval has passed
+    """
+    print("\n🔍 Testing _get_performance_metrics memory sampling")
+    
+    import time
+    from mcp_excel.core import cache
+    
+    ops = BaseOperations(file_loader)
+    monkeypatch.setattr(cache, "_memory_checked_at", None)  # Start without a shared reading
+    calls = count_calls(cache._process, "memory_info")
+    
+    # Act
+    first = ops._get_performance_metrics(time.time(), 10, False)
+    second = ops._get_performance_metrics(time.time(), 10, False)
+    monkeypatch.setattr(cache, "MEMORY_CHECK_INTERVAL", 0.0)
+    ops._get_performance_metrics(time.time(), 10, False)
+    
+    # Assert
+    print(f"  memory_info() calls: {len(calls)}")
+    
+    assert second.memory_used_mb == first.memory_used_mb, "Burst should share one reading"
+    assert first.memory_used_mb > 0, "Should report memory usage"
+    assert len(calls) == 2, f"Expected 2 memory_info() calls, got {len(calls)}"